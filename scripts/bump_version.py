@@ -7,19 +7,31 @@ Automatically updates version in pyproject.toml and creates git tags
 import re
 import sys
 from pathlib import Path
-from typing import Tuple
+from typing import Optional, Tuple
 
+# The project version is the top-level `version = ` key; anchoring it keeps
+# keys such as mypy's `python_version = "3.8"` from matching
+PYPROJECT_VERSION_PATTERN = re.compile(r'^version = "([^"]*)"', re.MULTILINE)
+SETUP_VERSION_PATTERN = re.compile(r'version="[^"]*"')
+VERSION_PATTERN = re.compile(r"^(\d+)\.(\d+)\.(\d+)$")
 
-def get_current_version() -> str:
-    """Get current version from pyproject.toml"""
+
+def read_pyproject() -> str:
+    """Read pyproject.toml"""
     pyproject_path = Path("pyproject.toml")
     if not pyproject_path.exists():
         raise FileNotFoundError("pyproject.toml not found")
 
     with open(pyproject_path, "r") as f:
-        content = f.read()
+        return f.read()
+
 
-    version_match = re.search(r'version = "([^"]+)"', content)
+def get_current_version(content: Optional[str] = None) -> str:
+    """Get current version from pyproject.toml (or its already-read content)"""
+    if content is None:
+        content = read_pyproject()
+
+    version_match = PYPROJECT_VERSION_PATTERN.search(content)
     if not version_match:
         raise ValueError("Version not found in pyproject.toml")
 
@@ -28,7 +40,7 @@ def get_current_version() -> str:
 
 def parse_version(version: str) -> Tuple[int, int, int]:
     """Parse version string into major, minor, patch"""
-    match = re.match(r"^(\d+)\.(\d+)\.(\d+)$", version)
+    match = VERSION_PATTERN.match(version)
     if not match:
         raise ValueError(f"Invalid version format: {version}")
     return int(match.group(1)), int(match.group(2)), int(match.group(3))
@@ -48,28 +60,28 @@ def bump_version(current_version: str, bump_type: str) -> str:
         raise ValueError(f"Invalid bump type: {bump_type}")
     
     # Validate the generated version matches expected format
-    if not re.match(r"^\d+\.\d+\.\d+$", new_version):
+    if not VERSION_PATTERN.match(new_version):
         raise ValueError(f"Generated invalid version format")
     
     return new_version
 
 
-def update_pyproject_version(new_version: str) -> None:
-    """Update version in pyproject.toml"""
+def update_pyproject_version(new_version: str, content: Optional[str] = None) -> None:
+    """Update version in pyproject.toml (starting from its already-read content)"""
     pyproject_path = Path("pyproject.toml")
 
-    with open(pyproject_path, "r") as f:
-        content = f.read()
+    if content is None:
+        content = read_pyproject()
 
     # Validate version format before use
-    if not re.match(r"^\d+\.\d+\.\d+$", new_version):
+    if not VERSION_PATTERN.match(new_version):
         raise ValueError(f"Invalid version format: {new_version}")
     
     # Update version in pyproject.toml
-    content = re.sub(
-        r'version = "[^"]*"',
+    content = PYPROJECT_VERSION_PATTERN.sub(
         f'version = "{new_version}"',
-        content)
+        content,
+        count=1)
 
     with open(pyproject_path, "w") as f:
         f.write(content)
@@ -88,11 +100,11 @@ def update_setup_py_version(new_version: str) -> None:
         content = f.read()
 
     # Validate version format before use
-    if not re.match(r"^\d+\.\d+\.\d+$", new_version):
+    if not VERSION_PATTERN.match(new_version):
         raise ValueError(f"Invalid version format: {new_version}")
     
     # Update version in setup.py
-    content = re.sub(r'version="[^"]*"', f'version="{new_version}"', content)
+    content = SETUP_VERSION_PATTERN.sub(f'version="{new_version}"', content, count=1)
 
     with open(setup_path, "w") as f:
         f.write(content)
@@ -112,13 +124,14 @@ def main():
         sys.exit(1)
 
     try:
-        current_version = get_current_version()
+        pyproject_content = read_pyproject()
+        current_version = get_current_version(pyproject_content)
         print(f"Current version: {current_version}")
 
         new_version = bump_version(current_version, bump_type)
         print(f"New version: {new_version}")
 
-        update_pyproject_version(new_version)
+        update_pyproject_version(new_version, pyproject_content)
         update_setup_py_version(new_version)
 
         print(f"\nVersion bumped successfully to {new_version}")
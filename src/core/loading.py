@@ -50,6 +50,7 @@ class LoadingSpinner:
             speed: Animation speed in seconds
         """
         self.message = message
+        self._width = len(message)
         self.style = style
         self.speed = speed
         self.frames = self.SPINNER_STYLES.get(
@@ -82,6 +83,12 @@ class LoadingSpinner:
         if self.thread:
             self.thread.join(timeout=0.1)
 
+    def update(self, message: str):
+        """Replace the message shown next to the spinner"""
+        with self._lock:
+            self.message = message
+            self._width = max(self._width, len(message))
+
     def _animate(self):
         """Animation loop"""
         while self.active:
@@ -90,14 +97,16 @@ class LoadingSpinner:
                     break
                 frame = self.frames[self.index]
                 self.index = (self.index + 1) % len(self.frames)
+                # Pad so a shorter message overwrites a longer one
+                message = self.message.ljust(self._width)
 
             # Write the frame
-            sys.stdout.write(f"\r{frame} {self.message}")
+            sys.stdout.write(f"\r{frame} {message}")
             sys.stdout.flush()
             time.sleep(self.speed)
 
         # Clear the line when stopped
-        sys.stdout.write("\r" + " " * (len(self.message) + 10) + "\r")
+        sys.stdout.write("\r" + " " * (self._width + 10) + "\r")
         sys.stdout.flush()
 
     def __enter__(self):
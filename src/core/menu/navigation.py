@@ -3,34 +3,33 @@ Menu navigation and input handling
 """
 
 import sys
+import time
 from typing import List, Any
 
+# Probe the platform's raw-input modules once, at import time
+try:
+    import tty
+    import termios
+except ImportError:
+    tty = termios = None
 
-class MenuNavigation:
-    """Handles menu navigation and user input"""
+try:
+    import msvcrt
+except ImportError:
+    msvcrt = None
 
-    def __init__(self):
-        self._has_termios: bool = self._check_termios()
-        self._has_msvcrt: bool = self._check_msvcrt()
+# Final byte of an arrow-key sequence -> selection delta
+_WINDOWS_ARROWS = {"H": -1, "P": 1}  # after "\xe0" or "\x00"
+_ANSI_ARROWS = {"A": -1, "B": 1}     # after "\x1b["
+_DIGITS = frozenset("0123456789")
 
-    def _check_termios(self) -> bool:
-        """Check if termios is available"""
-        try:
-            import tty  # noqa: F401
-            import termios  # noqa: F401
 
-            return True
-        except ImportError:
-            return False
-
-    def _check_msvcrt(self) -> bool:
-        """Check if msvcrt is available"""
-        try:
-            import msvcrt  # noqa: F401
+class MenuNavigation:
+    """Handles menu navigation and user input"""
 
-            return True
-        except ImportError:
-            return False
+    def __init__(self):
+        self._has_termios: bool = termios is not None
+        self._has_msvcrt: bool = msvcrt is not None
 
     def has_arrow_support(self) -> bool:
         """Check if terminal supports arrow keys"""
@@ -62,21 +61,28 @@ class MenuNavigation:
         last_processed_key = None
         key_debounce_time = 0.02  # Reduced debounce for more responsive feel
 
+        # Bind per-keypress lookups to locals once, outside the loop
+        write = sys.stdout.write
+        flush = sys.stdout.flush
+        getch = self._getch
+        now = time.time
+        is_windows = self._has_msvcrt
+        n_items = len(items)
+        show_cursor = renderer.SHOW_CURSOR
+
         # Initial display
         if initial_display:
             renderer.display(items, selected_idx, initial=True)
-        sys.stdout.write(renderer.HIDE_CURSOR)
-        sys.stdout.flush()
+        write(renderer.HIDE_CURSOR)
+        flush()
 
         try:
-            import time
-
             last_key_time = 0
 
             while True:
                 try:
-                    key = self._getch()
-                    current_time = time.time()
+                    key = getch()
+                    current_time = now()
 
                     # Debounce: ignore if same key processed too quickly
                     if (
@@ -92,23 +98,16 @@ class MenuNavigation:
                     new_idx = selected_idx
                     should_select = False
 
-                    if self._has_msvcrt:  # Windows
+                    if is_windows:  # Windows
                         if key in ("\xe0", "\x00"):
-                            arrow = self._getch()
-                            if arrow == "H":  # Up
-                                new_idx = (
-                                    (selected_idx - 1) % len(items)
-                                    if selected_idx > 0
-                                    else len(items) - 1
-                                )
-                            elif arrow == "P":  # Down
-                                new_idx = (selected_idx + 1) % len(items)
+                            delta = _WINDOWS_ARROWS.get(getch())
+                            if delta:
+                                new_idx = (selected_idx + delta) % n_items
                         elif key == "\r":  # Enter
                             should_select = True
-                        elif key.isdigit():
+                        elif key in _DIGITS:
                             num = int(key)
-                            if 1 <= num <= len(items):
-                                should_exit = True
+                            if 1 <= num <= n_items:
                                 selected_idx = num - 1
                                 should_select = True
                         elif key == "\x03":  # Ctrl+C
@@ -118,32 +117,26 @@ class MenuNavigation:
 
                     else:  # Unix/Linux/Mac
                         if key == "\x1b":  # ESC sequence
-                            next_key = self._getch()
+                            next_key = getch()
                             if next_key == "[":
-                                arrow = self._getch()
-                                if arrow == "A":  # Up
-                                    new_idx = (
-                                        (selected_idx - 1) % len(items)
-                                        if selected_idx > 0
-                                        else len(items) - 1
-                                    )
-                                elif arrow == "B":  # Down
-                                    new_idx = (selected_idx + 1) % len(items)
-                        elif key in ["\r", "\n"]:  # Enter
+                                delta = _ANSI_ARROWS.get(getch())
+                                if delta:
+                                    new_idx = (selected_idx + delta) % n_items
+                        elif key in ("\r", "\n"):  # Enter
                             should_select = True
-                        elif key.isdigit():
+                        elif key in _DIGITS:
                             num = int(key)
-                            if 1 <= num <= len(items):
+                            if 1 <= num <= n_items:
                                 selected_idx = num - 1
                                 should_select = True
-                        elif key in ["\x03", "\x04"]:  # Ctrl+C or Ctrl+D
+                        elif key in ("\x03", "\x04"):  # Ctrl+C or Ctrl+D
                             # For Ctrl+C, raise KeyboardInterrupt to be caught
                             # by outer function
                             if key == "\x03":
                                 raise KeyboardInterrupt()
                             # For Ctrl+D, exit normally
                             else:
-                                selected_idx = len(items) - 1
+                                selected_idx = n_items - 1
                                 should_select = True
 
                     # Update selection if changed
@@ -158,14 +151,14 @@ class MenuNavigation:
                             force_full_redraw=False)
 
                     if should_select:
-                        sys.stdout.write(renderer.SHOW_CURSOR)
-                        sys.stdout.flush()
+                        write(show_cursor)
+                        flush()
                         return selected_idx + 1
 
                 except KeyboardInterrupt:
-                    sys.stdout.write(renderer.SHOW_CURSOR)
-                    sys.stdout.flush()
-                    return len(items)
+                    write(show_cursor)
+                    flush()
+                    return n_items
                 except Exception as e:
                     # Log error but continue - at minimum print to stderr for debugging
                     print(f"⚠️  Menu navigation error: {type(e).__name__}: {e}", file=sys.stderr)
@@ -173,8 +166,8 @@ class MenuNavigation:
                     continue
 
         finally:
-            sys.stdout.write(renderer.SHOW_CURSOR)
-            sys.stdout.flush()
+            write(show_cursor)
+            flush()
 
     def _traditional_input(self, items: List[Any], renderer: Any) -> int:
         """Traditional number input method"""
@@ -196,17 +189,12 @@ class MenuNavigation:
     def _getch(self) -> str:
         """Get a single character from stdin"""
         if self._has_msvcrt:  # Windows
-            import msvcrt
-
             char = msvcrt.getch()
             try:
                 return char.decode("utf-8")
             except (UnicodeDecodeError, AttributeError):
                 return chr(ord(char))
         elif self._has_termios:  # Unix/Linux/Mac
-            import tty
-            import termios
-
             fd = sys.stdin.fileno()
             old_settings = termios.tcgetattr(fd)
             try:
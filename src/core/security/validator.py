@@ -23,6 +23,30 @@ class SecurityValidator:
     # Dangerous shell metacharacters that must be blocked
     DANGEROUS_SHELL_CHARS = frozenset([';', '&', '|', '$', '`', '(', ')', '{', '}', '[', ']', '<', '>', '!', '#', '~', '*', '?', '"', "'", '\\', '\n', '\r', '\t'])
 
+    # Dangerous characters/sequences, compiled once into a single alternation
+    DANGEROUS_COMMAND_PATTERN = re.compile('|'.join([
+        r'[;&|`]',      # Separators, &&/||, pipes, background, substitution
+        r'\$[({\[]',    # $( substitution, ${ and $[ expansion
+        r'\\x[0-9a-fA-F]{2}',  # Hex escape sequences
+        r'\\u[0-9a-fA-F]{4}',  # Unicode escape sequences
+        r'\x00',        # Null bytes (null byte injection)
+        r'%00',         # URL encoded null bytes
+    ]), re.IGNORECASE)
+    DANGEROUS_PATH_PATTERN = re.compile('|'.join([
+        r'\x00',  # Null bytes (null byte injection)
+        r'%00',   # URL encoded null bytes
+    ]), re.IGNORECASE)
+    # Git's branch name rules, as one pattern
+    DANGEROUS_BRANCH_PATTERN = re.compile('|'.join([
+        r'\.\..',        # Cannot contain .lock or .. in them.
+        r'@{',          # Cannot end with .lock or contain sequence @{.
+        r'\.$',         # Cannot end with .
+        r'^/',          # Cannot begin with /
+        r'//',          # Cannot contain double /
+        r'\s+$',        # Cannot end with whitespace
+        r'^\s+',        # Cannot begin with whitespace
+    ]))
+
     @staticmethod
     def validate_command_input(user_input: str) -> bool:
         """
@@ -38,29 +62,12 @@ class SecurityValidator:
             return True  # Empty input is safe
 
         # CRITICAL: Check for ANY dangerous shell metacharacters first
-        if any(char in SecurityValidator.DANGEROUS_SHELL_CHARS for char in user_input):
+        if not SecurityValidator.DANGEROUS_SHELL_CHARS.isdisjoint(user_input):
             return False
 
         # Check for dangerous characters/sequences
-        dangerous_patterns = [
-            r';',           # Command separators
-            r'&&',          # Command execution
-            r'\|\|',        # Command execution (OR operator)
-            r'\|',          # Pipe
-            r'\$\(',        # Command substitution
-            r'`',           # Command substitution
-            r'&',           # Background execution
-            r'\$\{',        # Variable expansion
-            r'\$\[',        # Array expansion
-            r'\\x[0-9a-fA-F]{2}',  # Hex escape sequences
-            r'\\u[0-9a-fA-F]{4}',  # Unicode escape sequences
-            r'\x00',        # Null bytes (null byte injection)
-            r'%00',         # URL encoded null bytes
-        ]
-
-        for pattern in dangerous_patterns:
-            if re.search(pattern, user_input, re.IGNORECASE):
-                return False
+        if SecurityValidator.DANGEROUS_COMMAND_PATTERN.search(user_input):
+            return False
 
         # Check against safe command pattern (stricter now - no spaces or =)
         return bool(SecurityValidator.SAFE_COMMAND_PATTERN.match(user_input))
@@ -103,14 +110,8 @@ class SecurityValidator:
             return False
 
         # Additional check: prohibit certain dangerous patterns
-        dangerous_path_patterns = [
-            r'\x00',  # Null bytes (null byte injection)
-            r'%00',   # URL encoded null bytes
-        ]
-
-        for pattern in dangerous_path_patterns:
-            if re.search(pattern, path, re.IGNORECASE):
-                return False
+        if SecurityValidator.DANGEROUS_PATH_PATTERN.search(path):
+            return False
 
         return True
 
@@ -161,19 +162,8 @@ class SecurityValidator:
             return True  # Empty branch name is safe
 
         # Git has specific rules for branch names - validate against them
-        dangerous_patterns = [
-            r'\.\..',        # Cannot contain .lock or .. in them.
-            r'@{',          # Cannot end with .lock or contain sequence @{.
-            r'\.$',         # Cannot end with .
-            r'^/',          # Cannot begin with /
-            r'//',          # Cannot contain double /
-            r'\s+$',        # Cannot end with whitespace
-            r'^\s+',        # Cannot begin with whitespace
-        ]
-
-        for pattern in dangerous_patterns:
-            if re.search(pattern, branch_name):
-                return False
+        if SecurityValidator.DANGEROUS_BRANCH_PATTERN.search(branch_name):
+            return False
 
         return bool(
             SecurityValidator.SAFE_BRANCH_NAME_PATTERN.match(branch_name))
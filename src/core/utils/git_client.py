@@ -2,9 +2,15 @@
 automation/core/git_client.py
 Unified Git client for all Git operations
 """
+import os
+import shutil
+import signal
 import subprocess
+import sys
+import threading
+from collections import deque
 from pathlib import Path
-from typing import List, Optional, Dict, Any, Tuple
+from typing import List, Optional, Dict, Any, Tuple, Callable, Deque
 from datetime import datetime
 
 from .exceptions import (
@@ -18,6 +24,23 @@ from .exceptions import (
 # Import security and logging modules inside functions to avoid circular
 # imports
 
+# Resolved once so commands don't repeat the PATH search; argv[0] stays
+# 'git' for validation and logging
+_GIT_EXECUTABLE = shutil.which('git')
+
+# Seconds a timed-out process group gets to exit before it is killed
+_GROUP_KILL_GRACE = 0.5
+
+# stderr lines kept when a command's stderr is streamed to a callback
+_STDERR_TAIL_LINES = 256
+
+
+def _executable_for(cmd: List[str]) -> Optional[str]:
+    """Get the resolved program for cmd (None lets subprocess search PATH)"""
+    if cmd and cmd[0] == 'git':
+        return _GIT_EXECUTABLE
+    return None
+
 
 class GitClient:
     """
@@ -58,6 +81,7 @@ class GitClient:
         try:
             result = subprocess.run(
                 cmd,
+                executable=_executable_for(cmd),
                 cwd=self.working_dir,
                 capture_output=True,
                 text=True,
@@ -650,7 +674,10 @@ class GitClient:
         self,
         cmd: List[str],
         check: bool = False,
-        timeout: int = 30
+        timeout: int = 30,
+        kill_process_group: bool = False,
+        on_stderr_line: Optional[Callable[[str], None]] = None,
+        text: bool = True
     ) -> subprocess.CompletedProcess:
         """
         Run Git command with proper error handling
@@ -659,6 +686,13 @@ class GitClient:
             cmd: Command to run
             check: Raise on non-zero return code
             timeout: Command timeout in seconds
+            kill_process_group: Run in a new process group and kill the
+                whole group on timeout (for commands that spawn helpers)
+            on_stderr_line: Called with each stderr line as it arrives;
+                implies kill_process_group, and only the last lines are
+                kept in the returned stderr
+            text: Decode output as UTF-8; False returns raw bytes so
+                callers can decode paths with os.fsdecode
         """
         # Import security and logging modules here to avoid circular imports
         from core.security.validator import SecurityValidator
@@ -672,30 +706,46 @@ class GitClient:
                     suggestion="Use only safe command elements without shell metacharacters")
 
         try:
-            # Ensure shell=False to prevent shell injection
-            result = subprocess.run(
-                cmd,
-                cwd=self.working_dir,
-                capture_output=True,
-                text=True,
-                encoding='utf-8',
-                errors='replace',
-                timeout=timeout,
-                shell=False  # Explicitly disable shell to prevent injection
-            )
+            if kill_process_group or on_stderr_line is not None:
+                result = self._run_in_process_group(
+                    cmd, timeout, on_stderr_line)
+            else:
+                decode_kwargs = {}
+                if text:
+                    decode_kwargs = {
+                        'text': True,
+                        'encoding': 'utf-8',
+                        'errors': 'replace'
+                    }
+                # Ensure shell=False to prevent shell injection
+                result = subprocess.run(
+                    cmd,
+                    executable=_executable_for(cmd),
+                    cwd=self.working_dir,
+                    capture_output=True,
+                    timeout=timeout,
+                    shell=False,  # Explicitly disable shell to prevent injection
+                    **decode_kwargs
+                )
 
             # Log command execution for audit purposes
             log_command_execution(' '.join(cmd), 'N/A', result.returncode == 0)
 
             if check and result.returncode != 0:
+                stderr = result.stderr
+                if isinstance(stderr, bytes):
+                    stderr = stderr.decode('utf-8', errors='replace')
                 raise GitCommandError(
                     command=' '.join(cmd),
                     return_code=result.returncode,
-                    stderr=result.stderr
+                    stderr=stderr
                 )
 
             return result
 
+        except GitCommandError:
+            # Already carries stderr and return code; don't rewrap below
+            raise
         except subprocess.TimeoutExpired:
             log_command_execution(' '.join(cmd), 'N/A', False)
             raise GitError(
@@ -712,6 +762,117 @@ class GitClient:
                 details={"error": str(e)}
             )
 
+    def _run_in_process_group(
+        self,
+        cmd: List[str],
+        timeout: int,
+        on_stderr_line: Optional[Callable[[str], None]] = None
+    ) -> subprocess.CompletedProcess:
+        """
+        Run command in its own process group
+
+        subprocess.run only kills the direct child on timeout, leaving
+        transport helpers such as git-remote-https or ssh running. Here the
+        whole group is terminated before TimeoutExpired propagates.
+        """
+        if sys.platform == 'win32':
+            group_kwargs = {
+                'creationflags': subprocess.CREATE_NEW_PROCESS_GROUP}
+        else:
+            group_kwargs = {'start_new_session': True}
+
+        process = subprocess.Popen(
+            cmd,
+            executable=_executable_for(cmd),
+            cwd=self.working_dir,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+            text=True,
+            encoding='utf-8',
+            errors='replace',
+            shell=False,
+            **group_kwargs
+        )
+        if on_stderr_line is not None:
+            stdout, stderr = self._communicate_streaming(
+                process, timeout, on_stderr_line)
+        else:
+            try:
+                stdout, stderr = process.communicate(timeout=timeout)
+            except BaseException:
+                # Timeout or Ctrl+C; the new group no longer sees terminal
+                # signals
+                self._terminate_process_group(process)
+                raise
+
+        return subprocess.CompletedProcess(
+            cmd, process.returncode, stdout, stderr)
+
+    def _communicate_streaming(
+        self,
+        process: subprocess.Popen,
+        timeout: int,
+        on_stderr_line: Callable[[str], None]
+    ) -> Tuple[str, str]:
+        """
+        Wait for process, handing stderr lines to a callback as they arrive
+
+        Returns:
+            Tuple of (full stdout, last _STDERR_TAIL_LINES lines of stderr)
+        """
+        stdout_parts: List[str] = []
+        stderr_tail: Deque[str] = deque(maxlen=_STDERR_TAIL_LINES)
+
+        def read_stdout():
+            stdout_parts.append(process.stdout.read())
+
+        def read_stderr():
+            # Universal newlines turn carriage-return progress into lines
+            for line in process.stderr:
+                stderr_tail.append(line)
+                on_stderr_line(line.rstrip('\n'))
+
+        readers = [
+            threading.Thread(target=read_stdout, daemon=True),
+            threading.Thread(target=read_stderr, daemon=True)
+        ]
+        for reader in readers:
+            reader.start()
+
+        try:
+            process.wait(timeout=timeout)
+        except BaseException:
+            self._terminate_process_group(process)
+            raise
+
+        for reader in readers:
+            reader.join()
+
+        return ''.join(stdout_parts), ''.join(stderr_tail)
+
+    @staticmethod
+    def _terminate_process_group(process: subprocess.Popen) -> None:
+        """Terminate a process group, escalating to a kill after a grace period"""
+        try:
+            if sys.platform == 'win32':
+                process.send_signal(signal.CTRL_BREAK_EVENT)
+            else:
+                os.killpg(process.pid, signal.SIGTERM)
+        except OSError:
+            pass
+
+        try:
+            process.wait(timeout=_GROUP_KILL_GRACE)
+        except subprocess.TimeoutExpired:
+            try:
+                if sys.platform == 'win32':
+                    process.kill()
+                else:
+                    os.killpg(process.pid, signal.SIGKILL)
+            except OSError:
+                pass
+            process.wait()
+
 
 # Singleton instance
 _git_client: Optional[GitClient] = None
@@ -5,7 +5,6 @@ Main entry point for Python Automation System
 
 import sys
 import os
-import io
 from pathlib import Path
 import subprocess
 
@@ -16,11 +15,13 @@ if sys.platform == "win32":
         # Enable ANSI escape codes on Windows 10+
         kernel32 = ctypes.windll.kernel32
         kernel32.SetConsoleMode(kernel32.GetStdHandle(-11), 7)
+        # Switch the console to UTF-8 (what `chcp 65001` does, minus the shell)
+        kernel32.SetConsoleOutputCP(65001)
     except (OSError, AttributeError):
         # Fall back gracefully if ANSI not supported
         pass
-    # Ensure stdout uses UTF-8 encoding
-    sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding="utf-8")
+    # Ensure stdout uses UTF-8 encoding, keeping the existing stream object
+    sys.stdout.reconfigure(encoding="utf-8")
 
 
 # Add src directory to path to enable imports
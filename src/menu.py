@@ -19,7 +19,8 @@ class MainMenu(Menu):
     """Main menu for the automation system - Updated with Dev Mode"""
 
     def __init__(self):
-        # Initialize dependencies ONCE before calling parent __init__
+        # Sub-menus are built on first use, so startup only imports what the
+        # user actually opens
         self._git_menu = None
         self._structure_viewer = None
         self._folder_nav = None
@@ -38,21 +39,6 @@ class MainMenu(Menu):
         if self.items:
             return
 
-        # Import here to avoid circular imports
-        from modules.git_operations import GitMenu
-        from modules.project_management import StructureViewer, FolderNavigator
-        from modules.web_development import DevModeMenu
-
-        # Create instances once and reuse them
-        if self._git_menu is None:
-            self._git_menu = GitMenu()
-        if self._structure_viewer is None:
-            self._structure_viewer = StructureViewer()
-        if self._folder_nav is None:
-            self._folder_nav = FolderNavigator()
-        if self._dev_mode_menu is None:
-            self._dev_mode_menu = DevModeMenu()
-
         # Create menu items with bound methods
         self.items = [
             MenuItem("GitHub Operations", self._run_git_operations),
@@ -64,21 +50,34 @@ class MainMenu(Menu):
 
     def _run_git_operations(self) -> Optional[str]:
         """Run GitHub operations menu"""
+        if self._git_menu is None:
+            # Import here to avoid circular imports
+            from modules.git_operations import GitMenu
+            self._git_menu = GitMenu()
         self._git_menu.run()
         return None
 
     def _show_structure(self) -> Optional[str]:
         """Show project structure"""
+        if self._structure_viewer is None:
+            from modules.project_management import StructureViewer
+            self._structure_viewer = StructureViewer()
         self._structure_viewer.show_structure()
         return None
 
     def _navigate_folders(self) -> Optional[str]:
         """Navigate folders"""
+        if self._folder_nav is None:
+            from modules.project_management import FolderNavigator
+            self._folder_nav = FolderNavigator()
         self._folder_nav.navigate()
         return None
 
     def _run_dev_mode(self) -> Optional[str]:
         """Run Dev Mode menu"""
+        if self._dev_mode_menu is None:
+            from modules.web_development import DevModeMenu
+            self._dev_mode_menu = DevModeMenu()
         self._dev_mode_menu.run()
         return None
 
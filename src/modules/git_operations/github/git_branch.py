@@ -67,13 +67,29 @@ class GitBranch:
 
     def _has_uncommitted_changes(self) -> bool:
         """Check if there are uncommitted changes"""
+        # Only the first byte of porcelain output matters, so stop reading
+        # (and stop git) as soon as one entry shows up
         try:
-            result = self._run_command(['git', 'status', '--porcelain'], check=False)
-            if result.returncode == 0:
-                return bool(result.stdout.strip())
-        except (subprocess.CalledProcessError, FileNotFoundError, OSError):
-            pass
-        return False
+            proc = subprocess.Popen(
+                ['git', 'status', '--porcelain', '-z'],
+                cwd=self.current_dir,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.DEVNULL
+            )
+        except (FileNotFoundError, OSError):
+            return False
+
+        try:
+            first_byte = proc.stdout.read(1)
+        finally:
+            if proc.poll() is None:
+                proc.terminate()
+            proc.stdout.close()
+            proc.wait()
+
+        # Outside a repository git writes only to stderr, so no byte means
+        # no changes
+        return bool(first_byte)
 
     def _print_header(self, title: str) -> None:
         """Print formatted header"""
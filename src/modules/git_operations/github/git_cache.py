@@ -5,23 +5,62 @@ The folder will be removed from git tracking but kept in your local directory.
 """
 import subprocess
 import os
+import shlex
+import shutil
+from typing import List, Optional
+from core.menu import Menu, MenuItem
+
+# Resolved once so each git call skips the PATH search (None if missing)
+GIT_EXECUTABLE = shutil.which("git")
+
+_BAR = "=" * 70
+_BANNER = f"\n{_BAR}\n  {{title}}\n{_BAR}\n"
 
 
 class GitCache:
     """Simple git cache operations to unstage files"""
 
-    def unstage_directory(self):
-        """Run git rm --cached -r on working directory to unstage all files"""
-        print("\n" + "=" * 70)
-        print("  UNSTAGE WORKING DIRECTORY")
-        print("=" * 70 + "\n")
+    def show_cache_menu(self) -> None:
+        """Show the git cache operations menu"""
+        menu = GitCacheMenu(self)
+        menu.run()
+
+    def unstage_directory(self, pathspecs: Optional[List[str]] = None):
+        """
+        Run git rm --cached -r to unstage files from the working directory
+
+        Args:
+            pathspecs: Paths/patterns to untrack (None = prompt the user,
+                empty input untracks the whole working directory)
+        """
+        print(_BANNER.format(title="UNSTAGE WORKING DIRECTORY"))
+
+        if GIT_EXECUTABLE is None:
+            print(" Git is not installed or not in PATH")
+            input("\nPress Enter to continue...")
+            return
 
         if not self._is_git_repo():
             print(" Not a git repository. Please initialize git first.")
             input("\nPress Enter to continue...")
             return
 
-        print("This will remove all files from git tracking (unstage) but keep them in your local directory.")
+        if pathspecs is None:
+            print("Enter the paths or patterns to untrack (e.g. .env 'secrets/*.json').")
+            print("Leave empty to untrack the ENTIRE working directory.")
+            try:
+                pathspecs = shlex.split(input("\nPaths: ").strip())
+            except ValueError as e:
+                print(f" Invalid path list: {e}")
+                input("\nPress Enter to continue...")
+                return
+
+        untrack_all = not pathspecs
+        if untrack_all:
+            pathspecs = ["."]
+            print("This will remove all files from git tracking (unstage) but keep them in your local directory.")
+        else:
+            print(f"This will remove {', '.join(pathspecs)} from git tracking but keep them in your local directory.")
         print("Files will remain on disk but will no longer be tracked by git.")
 
         confirm = input("\nContinue with unstaging? (y/n): ").lower()
@@ -30,29 +69,31 @@ class GitCache:
             input("\nPress Enter to continue...")
             return
 
-        # Run git rm --cached -r .
+        # Scope git rm to the requested pathspecs. Output is streamed for
+        # targeted removals and discarded for the whole tree, where git
+        # would print one line per tracked file.
         try:
             result = subprocess.run(
-                ["git", "rm", "--cached", "-r", "."],
-                capture_output=True,
+                [GIT_EXECUTABLE, "rm", "--cached", "-r", "--"] + pathspecs,
+                stdout=subprocess.DEVNULL if untrack_all else None,
+                stderr=subprocess.PIPE,
                 text=True,
                 encoding='utf-8',
                 errors='replace'
             )
 
             if result.returncode == 0:
-                print(" SUCCESS! Working directory has been unstaged.")
+                if untrack_all:
+                    print(" SUCCESS! Working directory has been unstaged.")
+                else:
+                    print(" SUCCESS! Selected paths have been unstaged.")
                 print(" All files remain in your local directory")
                 print(" Files are no longer tracked by git")
-                if result.stdout:
-                    print(f"\nGit output:\n{result.stdout}")
             else:
                 print(" FAILED to unstage directory.")
                 if result.stderr:
                     print(f"Error: {result.stderr}")
 
-        except FileNotFoundError:
-            print(" Git is not installed or not in PATH")
         except Exception as e:
             print(f" Unexpected error: {e}")
 
@@ -60,14 +101,31 @@ class GitCache:
 
     def _is_git_repo(self):
         """Check if current directory is a git repository"""
-        try:
-            result = subprocess.run(
-                ["git", "rev-parse", "--is-inside-work-tree"],
-                capture_output=True,
-                text=True,
-                encoding='utf-8',
-                errors='replace'
-            )
-            return result.returncode == 0
-        except FileNotFoundError:
+        if GIT_EXECUTABLE is None:
             return False
+        result = subprocess.run(
+            [GIT_EXECUTABLE, "rev-parse", "--is-inside-work-tree"],
+            capture_output=True,
+            text=True,
+            encoding='utf-8',
+            errors='replace'
+        )
+        return result.returncode == 0
+
+
+class GitCacheMenu(Menu):
+    """Menu for git cache operations with arrow navigation"""
+
+    def __init__(self, git_cache: GitCache):
+        self.git_cache = git_cache
+        super().__init__("Git Cache (Handle Sensitive Files)")
+
+    def setup_items(self):
+        """Setup menu items for git cache operations"""
+        self.items = [
+            MenuItem(
+                "Unstage Working Directory",
+                lambda: self.git_cache.unstage_directory()),
+            MenuItem(
+                "Back to GitHub Operations",
+                lambda: "exit")]
@@ -159,11 +159,6 @@ class GitInitializer:
                 commit_msg = input("Enter commit message: ").strip()
                 if not commit_msg:
                     commit_msg = "Update files before push"
-                # Auto-add heart emoji at the beginning if not already present
-                if not commit_msg.startswith(''):
-                    commit_msg = f" {commit_msg}"
-                if not commit_msg:
-                    commit_msg = "Update files before push"
 
                 print("\n Adding files...")
                 if not self._run_command(["git", "add", "."]):
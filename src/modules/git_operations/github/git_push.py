@@ -3,13 +3,19 @@ automation/github/git_push.py
 Enhanced Git push with comprehensive retry strategies and automatic changelog generation
 UPDATED: Automatically generates changelog after successful push
 """
+from functools import lru_cache
 from pathlib import Path
-from typing import Optional, List, Tuple, Dict
+from typing import Optional, List, Tuple, Dict, Set, FrozenSet, Callable
+import os
+import random
+import re
+import select
 import sys
 import time
 import subprocess
+import threading
 
-from core.utils.git_client import get_git_client
+from core.utils.git_client import GitClient, get_git_client
 from core.utils.exceptions import (
     ExceptionHandler,
     GitError,
@@ -22,6 +28,253 @@ from core.loading import LoadingSpinner
 # Import GroqCommitGenerator for AI commit message generation
 from .grok_commit_generator import GroqCommitGenerator
 
+# Maximum paths passed to a single `git add` call (keeps argv well under
+# ARG_MAX on every platform)
+_ADD_BATCH_SIZE = 500
+
+# Staging diagnostics thresholds
+_BINARY_EXTENSIONS = ('.exe', '.dll', '.so', '.dylib')
+_LARGE_FILE_BYTES = 100 << 20  # 100MB
+
+# Push failure classification; one pass over the error text, each match
+# reports its category through the group name
+_ERROR_CATEGORY_RE = re.compile(
+    r'(?P<auth>authentication|credentials|could not authenticate'
+    r'|fatal:.*authentication|http.*403|403|401)'
+    r'|(?P<permission>permission denied|insufficient permissions'
+    r'|protected branch|push declined|branch is protected'
+    r'|repository not found)'
+    r'|(?P<network>network|timeout|connection|could not resolve'
+    r'|host unreachable|could not read from remote|send pack|fetch failed)'
+    r'|(?P<hook>pre-push hook|hook declined|hook failed|husky|lint-staged)'
+    r'|(?P<diverged>diverged|non-fast-forward|rejected|fetch first'
+    r'|pull is required|fast-forward)'
+    r'|(?P<no_upstream>no upstream|no tracking|upstream branch|origin/'
+    r'|does not exist upstream)'
+    r'|(?P<large_file>large file|lfs|file too large|size exceeds'
+    r'|upload-pack|unpack error)'
+    r'|(?P<rate_limit>rate limit|api rate|too many requests'
+    r'|exceeded rate|abuse detection)',
+    re.IGNORECASE
+)
+
+# Strategies that can fix a classified push failure, in order of preference.
+# Network errors retry the same strategy; unclassified errors walk the full
+# PushConfig.strategies ladder.
+_STRATEGY_TRANSITIONS = {
+    'hook': ('no-verify', 'no-verify-upstream'),
+    'no_upstream': ('set-upstream', 'no-verify-upstream'),
+    'diverged': ('force-with-lease', 'force'),
+}
+
+
+@lru_cache(maxsize=None)
+def _get_changelog_generator():
+    """Import ChangelogGenerator once (deferred to avoid a circular import)"""
+    from ..changelog import ChangelogGenerator
+    return ChangelogGenerator
+
+
+# Push clients per working directory, with the index/HEAD mtimes they were
+# created under
+_CLIENT_CACHE: Dict[Path, Tuple[Tuple[Optional[int], ...], GitClient]] = {}
+
+
+def _cached_git_client(working_dir: Path) -> GitClient:
+    """
+    Get a Git client for working_dir, rebuilding it only when the repo moved
+
+    A new client is created (force_new) when the index or HEAD has been
+    rewritten since the cached one was made, keeping the fresh-client
+    guarantee of the push flow without paying for it on every push.
+    """
+    git_dir = working_dir / '.git'
+    state = []
+    for name in ('index', 'HEAD'):
+        try:
+            state.append(os.stat(git_dir / name).st_mtime_ns)
+        except OSError:
+            state.append(None)
+    state = tuple(state)
+
+    cached = _CLIENT_CACHE.get(working_dir)
+    if cached is not None and cached[0] == state:
+        return cached[1]
+
+    client = get_git_client(working_dir=working_dir, force_new=True)
+    _CLIENT_CACHE[working_dir] = (state, client)
+    return client
+
+
+# Change summary labels by porcelain status code; other codes containing
+# M or D fall back to the ' M' / ' D' labels
+_STATUS_LABELS = {
+    '??': "?? (untracked) ",
+    'A ': "A  (new)       ",
+    'M ': "M  (modified)  ",
+    ' M': "M  (modified)  ",
+    'MM': "M  (modified)  ",
+    'D ': "D  (deleted)   ",
+    ' D': "D  (deleted)   ",
+}
+
+# Banner rules shared by the push screens
+_BANNER60 = "=" * 60
+_BANNER70 = "=" * 70
+_BANNER78 = "=" * 78
+
+# Troubleshooting guides, written in one call each on the failure paths
+
+_STAGING_GUIDE = """
+ Staging Troubleshooting Guide:
+   1. Check if you're in a Git repository: git status
+   2. Check for file permission issues
+   3. Look for large files or binary files that might be problematic
+   4. Try staging files individually: git add <filename>
+   5. Check .gitignore for conflicting patterns
+   6. Verify file paths don't contain special characters
+
+"""
+
+_COMMIT_GUIDE = """
+ Commit Troubleshooting Guide:
+   1. Ensure you have staged changes: git status
+   2. Check commit message length and characters
+   3. Verify Git user configuration: git config user.name/user.email
+   4. Try with a simpler commit message
+
+"""
+
+_PUSH_FAILURE_GUIDE = f"""
+{_BANNER60}
+ PUSH FAILURE DIAGNOSTIC & SOLUTIONS
+{_BANNER60}
+
+ Common Push Failure Causes & Solutions:
+
+1.  NETWORK/CONNECTIVITY ISSUES:
+   • Check internet connection
+   • Verify remote URL: git remote -v
+   • Test connectivity: git ls-remote origin
+   • Try with different network or VPN
+
+2.  AUTHENTICATION ISSUES:
+   • Check Git credentials: git config --list
+   • Update GitHub token/SSH key
+   • Run: git credential-manager-core erase
+   • Re-authenticate: git push (will prompt)
+
+3.  REPOSITORY STATE ISSUES:
+   • Check repo status: git status
+   • View recent commits: git log --oneline -5
+   • Check branch tracking: git branch -vv
+   • Ensure branch exists on remote
+
+4.  PERMISSION ISSUES:
+   • Verify you have push access to the repository
+   • Check if branch is protected
+   • Ensure you're pushing to correct remote/branch
+
+5.  REPOSITORY SIZE ISSUES:
+   • Check for large files: git ls-files | xargs ls -la
+   • Use Git LFS for large files
+   • Consider splitting large commits
+
+ IMMEDIATE TROUBLESHOOTING STEPS:
+   1. Run: git status (check current state)
+   2. Run: git remote -v (verify remote URL)
+   3. Run: git branch -vv (check branch tracking)
+   4. Run: git push --verbose (detailed push output)
+   5. Try: git push --force-with-lease (if safe)
+
+ ALTERNATIVE APPROACHES:
+   • Create new branch: git checkout -b new-feature
+   • Reset and retry: git reset --soft HEAD~1
+   • Manual push: git push origin <branch-name>
+   • Use GitHub CLI: gh repo sync
+
+{_BANNER60}
+"""
+
+# Lines of git stderr worth reporting ahead of progress chatter, matched
+# against the whole stderr so it never has to be split into lines
+_ERROR_LINE_RE = re.compile(
+    r'^[ \t]*(?:!|fatal:).*|^.*error.*', re.IGNORECASE | re.MULTILINE)
+_FIRST_LINE_RE = re.compile(r'\S.*')
+
+
+@lru_cache(maxsize=32)
+def _summarize_stderr(stderr: str) -> str:
+    """Pick the most telling line of git's stderr (memoized; retries repeat it)"""
+    match = _ERROR_LINE_RE.search(stderr) or _FIRST_LINE_RE.search(stderr)
+    if match is None:
+        return "Unknown error"
+    return match.group().strip()[:100]
+
+
+def _git_user_identity(git: GitClient) -> Tuple[str, str]:
+    """Read user.name and user.email with one git config call"""
+    username = "<default_username>"
+    email = "<default_email>"
+
+    try:
+        # Keys are printed in config order, so later scopes win as with --get
+        result = git._run_command(
+            ['git', 'config', '--get-regexp', 'user.'], check=False)
+        if result.returncode == 0:
+            values = dict(
+                line.partition(' ')[::2] for line in result.stdout.splitlines())
+            username = values.get('user.name', '').strip() or username
+            email = values.get('user.email', '').strip() or email
+    except Exception:
+        pass
+
+    return username, email
+
+
+def _timed_input(prompt: str, timeout: float) -> Optional[str]:
+    """
+    Read a line from the terminal, giving up after timeout seconds
+
+    Returns:
+        The line without its newline, or None if the time ran out
+    """
+    print(prompt, end='', flush=True)
+
+    if sys.platform == 'win32':
+        import msvcrt
+
+        deadline = time.monotonic() + timeout
+        chars = []
+        while time.monotonic() < deadline:
+            if not msvcrt.kbhit():
+                time.sleep(0.05)
+                continue
+            char = msvcrt.getwche()
+            if char in ('\r', '\n'):
+                print()
+                return ''.join(chars)
+            if char == '\b':
+                if chars:
+                    chars.pop()
+                continue
+            chars.append(char)
+        return None
+
+    # A canonical-mode terminal is readable only once Enter is pressed
+    ready, _, _ = select.select([sys.stdin], [], [], timeout)
+    if not ready:
+        return None
+    return sys.stdin.readline().rstrip('\n')
+
+
+def _prefetch_changelog_generator():
+    """Warm _get_changelog_generator; failures surface at generation time"""
+    try:
+        _get_changelog_generator()
+    except Exception:
+        pass
+
 
 class PushStrategy:
     """Represents a push strategy with specific flags"""
@@ -39,6 +292,8 @@ class PushStrategy:
         self.description = description
         self.requires_confirmation = requires_confirmation
         self.is_destructive = is_destructive
+        # Full push command up to the remote and branch arguments
+        self.argv = ['git', 'push', '--progress', *flags]
 
     def __repr__(self):
         return f"PushStrategy({self.name})"
@@ -55,6 +310,11 @@ class PushConfig:
         self.enable_auto_upstream = True
         self.enable_force_push = True
         self.exponential_backoff = True
+        self.backoff_base = 2.0  # Growth factor between network retries
+        self.backoff_jitter = True  # Randomize waits so retries don't align
+        self.max_backoff = 30  # seconds, cap for a single wait
+        self.max_total_seconds = 300  # Overall budget for all push attempts
+        self.confirmation_timeout = 60  # seconds before a force push is declined
         self.auto_generate_changelog = True  # NEW: Enable auto-changelog
         self.auto_handle_gitignore = True  # NEW: Auto-handle .gitignore changes
 
@@ -120,6 +380,25 @@ class GitPushRetry:
         self.git = get_git_client()
         self.config = config or PushConfig()
         self.attempt_count = 0
+        # Resolved once; staging diagnostics and lock checks join onto it
+        self._working_dir = str(self.git.working_dir)
+        # Parsed `git status --porcelain -z`, shared until the index changes
+        self._status_cache: Optional[List[Tuple[str, str]]] = None
+        # time.monotonic() after which no further push attempts are made
+        self._deadline: Optional[float] = None
+        # Changelog generation runs here after a successful push
+        self._changelog_thread: Optional[threading.Thread] = None
+        # Repository facts from _probe_repo, refreshed on every push
+        self._repo_info: Optional[Dict] = None
+        # Why the last `git add .` failed; picks the staging fallbacks
+        self._last_staging_error: Optional[Exception] = None
+
+    def _use_git_client(self, git) -> None:
+        """Switch to a fresh Git client and drop state derived from the old one"""
+        self.git = git
+        self._working_dir = str(git.working_dir)
+        self._status_cache = None
+        self._repo_info = None
 
     @handle_errors()
     def push_with_retry(
@@ -141,6 +420,11 @@ class GitPushRetry:
         Returns:
             True if push succeeded, False otherwise
         """
+        self._status_cache = None
+        self._repo_info = None
+        # Let a previous push's changelog output finish before prompting
+        self.wait_changelog()
+
         # Get current branch if not specified
         if not branch:
             try:
@@ -170,10 +454,10 @@ class GitPushRetry:
                 return False
 
         # Wait for user confirmation before pushing
-        print("\n" + "="*60)
+        print("\n" + _BANNER60)
         print(" All commits created successfully!")
         print(" Ready to push to GitHub")
-        print("="*60)
+        print(_BANNER60)
         print("\n Press Enter to push changes to GitHub, or Ctrl+C to cancel...")
         try:
             input()
@@ -187,9 +471,11 @@ class GitPushRetry:
         # Handle results
         if push_success:
             self._show_push_summary()
-            # Generate changelog after successful push
+            # Generate changelog after successful push, off the main thread
             if self.config.auto_generate_changelog:
-                self._auto_generate_changelog()
+                self._changelog_thread = threading.Thread(
+                    target=self._auto_generate_changelog, daemon=True)
+                self._changelog_thread.start()
 
         return push_success
 
@@ -222,22 +508,7 @@ class GitPushRetry:
             print(f"   Detected {len(change_groups)} logical change group(s)")
 
             # Get git config for username and email
-            username = "<default_username>"
-            email = "<default_email>"
-
-            try:
-                user_result = self.git._run_command(['git', 'config', 'user.name'], check=False)
-                if user_result.returncode == 0 and user_result.stdout.strip():
-                    username = user_result.stdout.strip()
-            except Exception:
-                pass
-
-            try:
-                email_result = self.git._run_command(['git', 'config', 'user.email'], check=False)
-                if email_result.returncode == 0 and email_result.stdout.strip():
-                    email = email_result.stdout.strip()
-            except Exception:
-                pass
+            username, email = _git_user_identity(self.git)
 
             # Generate commit messages for each change group
             commit_messages = generator.generate_multiple_commit_messages(
@@ -265,9 +536,7 @@ class GitPushRetry:
         """Commit already-staged changes without staging"""
         try:
             # Check if there are staged changes
-            result = self.git._run_command(
-                ['git', 'diff', '--cached', '--quiet'], check=False)
-            if result.returncode == 0:
+            if not self._has_staged_changes():
                 print("  No staged changes to commit")
                 return False
 
@@ -290,11 +559,9 @@ class GitPushRetry:
                 print(f"   Files: {', '.join(files[:5])}" + ("..." if len(files) > 5 else ""))
 
                 # Stage only the files for this commit
-                for file_path in files:
-                    try:
-                        self.git._run_command(['git', 'add', file_path], check=True)
-                    except Exception as e:
-                        print(f"   Warning: Could not stage {file_path}: {e}")
+                _, failed_files = self._git_add_batch(files)
+                for file_path, error in failed_files:
+                    print(f"   Warning: Could not stage {file_path}: {error}")
 
                 # Commit with the generated message
                 try:
@@ -314,10 +581,7 @@ class GitPushRetry:
     def _auto_generate_changelog(self):
         """Automatically generate changelog for the latest commit"""
         try:
-            # Import here to avoid circular dependency
-            from ..changelog import ChangelogGenerator
-
-            changelog_gen = ChangelogGenerator()
+            changelog_gen = _get_changelog_generator()()
             # Generate changelog for the most recent commit
             changelog_gen.generate_changelog(num_commits=1)
 
@@ -325,24 +589,63 @@ class GitPushRetry:
             # Silently continue even if changelog generation fails
             pass
 
+    def wait_changelog(self, timeout: Optional[float] = 5) -> bool:
+        """
+        Wait for background changelog generation started by a push
+
+        Args:
+            timeout: Seconds to wait, or None to wait indefinitely
+
+        Returns:
+            True if no changelog generation is still running
+        """
+        thread = self._changelog_thread
+        if thread is None:
+            return True
+
+        thread.join(timeout)
+        if thread.is_alive():
+            return False
+
+        self._changelog_thread = None
+        return True
+
     def _execute_push_with_strategies(self, remote: str, branch: str) -> bool:
         """Try push with progressive strategies until success"""
         print(f" Pushing to {remote}/{branch}")
-        print(f" Max attempts: {len(self.config.strategies)}")
+        max_attempts = len(self.config.strategies)
+        print(f" Max attempts: {max_attempts}")
 
         last_error = None
-
-        for idx, strategy in enumerate(self.config.strategies, 1):
-            self.attempt_count = idx
-
-            print(
-                f"\n Attempt {idx}/{len(self.config.strategies)}: {strategy.name}")
+        self._deadline = time.monotonic() + self.config.max_total_seconds
+
+        # Warm the changelog import while the push waits on the network
+        if self.config.auto_generate_changelog:
+            threading.Thread(
+                target=_prefetch_changelog_generator, daemon=True).start()
+
+        attempt = 0
+        tried: Set[str] = set()
+        categories: FrozenSet[str] = frozenset()
+        # Narrowed after each failure; a hook failure, say, keeps ruling out
+        # strategies without --no-verify on later attempts
+        candidates = list(self.config.strategies)
+        strategy = self._next_strategy_for(categories, tried, candidates=candidates)
+
+        while strategy is not None:
+            attempt += 1
+            self.attempt_count = attempt
+            tried.add(strategy.name)
+
+            print(f"\n Attempt {attempt}/{max_attempts}: {strategy.name}")
             print(f"   Description: {strategy.description}")
 
             # Check if confirmation needed
             if strategy.requires_confirmation:
                 if not self._confirm_destructive_operation(strategy):
                     print(" Operation cancelled by user")
+                    strategy = self._next_strategy_for(
+                        categories, tried, candidates=candidates)
                     continue
 
             # Try the strategy with loading animation
@@ -356,13 +659,21 @@ class GitPushRetry:
 
             # Analyze error and decide next step
             should_continue, wait_time = self._analyze_error_and_decide(
-                error, idx, strategy
+                error, attempt, strategy
             )
 
             if not should_continue:
                 break
 
-            if wait_time > 0 and idx < len(self.config.strategies):
+            categories = self._classify_error(error)
+            candidates = [
+                s for s in candidates
+                if self._strategy_can_help(s, categories)
+            ]
+            strategy = self._next_strategy_for(
+                categories, tried, strategy, candidates)
+
+            if strategy is not None and wait_time > 0:
                 time.sleep(wait_time)
 
         # All strategies failed
@@ -379,19 +690,20 @@ class GitPushRetry:
         """Try a specific push strategy"""
         try:
             # Build git push command
-            cmd = ['git', 'push']
-            cmd.extend(strategy.flags)
-            cmd.extend([remote, branch])
+            cmd = strategy.argv + [remote, branch]
 
             # Show command being executed
             print(f"   $ {' '.join(cmd)}")
 
             # Execute with progress indicator
-            with LoadingSpinner(f"Pushing with {strategy.name}", style='dots'):
+            message = f"Pushing with {strategy.name}"
+            with LoadingSpinner(message, style='dots') as spinner:
                 result = self.git._run_command(
                     cmd,
                     check=True,
-                    timeout=self.config.network_timeout
+                    timeout=self.config.network_timeout,
+                    on_stderr_line=self._push_progress_callback(
+                        spinner, message)
                 )
 
             print(f"    Push successful!")
@@ -408,6 +720,15 @@ class GitPushRetry:
             print(f"    Unexpected error: {str(e)}")
             return False, e
 
+    @staticmethod
+    def _push_progress_callback(spinner: LoadingSpinner, message: str):
+        """Build a stderr callback that shows git's progress in the spinner"""
+        def show_progress(line: str):
+            line = line.strip()
+            if line:
+                spinner.update(f"{message} - {line[:60]}")
+        return show_progress
+
     def _try_push_strategy_with_animation(
         self,
         strategy: PushStrategy,
@@ -417,16 +738,17 @@ class GitPushRetry:
         """Try a specific push strategy with loading animation"""
         try:
             # Build git push command
-            cmd = ['git', 'push']
-            cmd.extend(strategy.flags)
-            cmd.extend([remote, branch])
+            cmd = strategy.argv + [remote, branch]
 
             # Execute with enhanced loading animation
-            with LoadingSpinner(f"Pushing to {remote}/{branch} using {strategy.name}", style='dots'):
+            message = f"Pushing to {remote}/{branch} using {strategy.name}"
+            with LoadingSpinner(message, style='dots') as spinner:
                 result = self.git._run_command(
                     cmd,
                     check=True,
-                    timeout=self.config.network_timeout
+                    timeout=self.config.network_timeout,
+                    on_stderr_line=self._push_progress_callback(
+                        spinner, message)
                 )
 
             print(f"    ✅ Push successful!")
@@ -454,78 +776,134 @@ class GitPushRetry:
         error: Optional[Exception],
         attempt: int,
         strategy: PushStrategy
-    ) -> Tuple[bool, int]:
+    ) -> Tuple[bool, float]:
         """Analyze error and decide whether to continue"""
         if not error:
             return False, 0
 
-        error_msg = str(error).lower()
-        if hasattr(error, 'stderr'):
-            error_msg = error_msg + " " + str(error.stderr).lower()
-
-        is_auth = any(x in error_msg for x in [
-            'authentication', 'permission denied', 'credentials',
-            'authentication failed', 'could not authenticate',
-            '403', '401', 'fatal:.*authentication', 'http.*403'
-        ])
-
-        is_network = any(x in error_msg for x in [
-            'network', 'timeout', 'connection', 'could not resolve',
-            'connection refused', 'connection timed out', 'host unreachable',
-            'could not read from remote', 'send pack', 'fetch failed'
-        ])
-
-        is_hook_error = any(x in error_msg for x in [
-            'pre-push hook', 'hook declined', 'hook failed',
-            'husky', 'lint-staged'
-        ])
-
-        is_diverged = any(x in error_msg for x in [
-            'diverged', 'non-fast-forward', 'rejected',
-            'fetch first', 'pull is required', 'fast-forward'
-        ])
-
-        is_no_upstream = any(x in error_msg for x in [
-            'no upstream', 'no tracking', 'upstream branch',
-            'origin/', 'does not exist upstream'
-        ])
-
-        is_permission = any(
-            x in error_msg for x in [
-                'permission denied',
-                'insufficient permissions',
-                'protected branch',
-                'push declined',
-                'branch is protected'])
-
-        is_large_file = any(x in error_msg for x in [
-            'large file', 'lfs', 'file too large', 'size exceeds',
-            'upload-pack', 'unpack error'
-        ])
-
-        is_rate_limit = any(x in error_msg for x in [
-            'rate limit', 'api rate', 'too many requests',
-            'exceeded rate', 'abuse detection'
-        ])
-
-        if is_auth:
+        categories = self._classify_error(error)
+
+        # Authentication and permission failures won't fix themselves
+        if categories & {'auth', 'permission'}:
             return False, 0
 
-        if is_network:
-            wait_time = 0
-            if self.config.exponential_backoff:
-                wait_time = min(2 ** attempt, 8)
-            else:
-                wait_time = self.config.retry_delay
-            should_continue = attempt < len(self.config.strategies)
-            return should_continue, wait_time
+        # Network errors back off; everything else moves on immediately
+        wait_time = self._backoff_delay(attempt) if 'network' in categories else 0
+        should_continue = (
+            attempt < len(self.config.strategies)
+            and self._within_deadline(wait_time)
+        )
+        return should_continue, wait_time
 
-        if is_permission:
-            return False, 0
+    def _classify_error(self, error: Optional[Exception]) -> FrozenSet[str]:
+        """
+        Get the failure categories (auth, network, hook, ...) of a push error
+
+        The result is stored on the exception, so the retry loop and the
+        failure guidance share one scan of a possibly long stderr.
+        """
+        if not error:
+            return frozenset()
+
+        categories = getattr(error, '_push_error_categories', None)
+        if categories is not None:
+            return categories
+
+        error_msg = str(error)
+        stderr = getattr(error, 'stderr', None)
+        if isinstance(stderr, bytes):
+            stderr = stderr.decode('utf-8', errors='replace')
+        if stderr:
+            error_msg = f"{error_msg} {stderr}"
+
+        # The pattern is case-insensitive, so no lowercased copy is needed
+        categories = frozenset(
+            match.lastgroup for match in _ERROR_CATEGORY_RE.finditer(error_msg)
+        )
+        try:
+            error._push_error_categories = categories
+        except AttributeError:
+            pass
+        return categories
+
+    def _next_strategy_for(
+        self,
+        categories: FrozenSet[str],
+        tried: Set[str],
+        last_strategy: Optional[PushStrategy] = None,
+        candidates: Optional[List[PushStrategy]] = None
+    ) -> Optional[PushStrategy]:
+        """
+        Pick the strategy to try after a failure
+
+        Args:
+            categories: Categories of the last failure (empty before the first attempt)
+            tried: Names of strategies already attempted or declined
+            last_strategy: Strategy that just failed, retried on network errors
+            candidates: Strategies still able to succeed (default: all)
+
+        Returns:
+            Next strategy, or None when nothing left can fix the failure
+        """
+        if candidates is None:
+            candidates = self.config.strategies
 
-        # For all other errors, continue to next strategy
-        should_continue = attempt < len(self.config.strategies)
-        return should_continue, 0
+        if 'network' in categories and last_strategy in candidates:
+            return last_strategy
+
+        strategies = {s.name: s for s in candidates}
+
+        matched = False
+        for category, names in _STRATEGY_TRANSITIONS.items():
+            if category not in categories:
+                continue
+            matched = True
+            for name in names:
+                if name in strategies and name not in tried:
+                    return strategies[name]
+
+        # Known failure with every fitting strategy used up
+        if matched:
+            return None
+
+        for strategy in candidates:
+            if strategy.name not in tried:
+                return strategy
+        return None
+
+    @staticmethod
+    def _strategy_can_help(
+        strategy: PushStrategy,
+        categories: FrozenSet[str]
+    ) -> bool:
+        """Check whether strategy could get past a failure with these categories"""
+        if categories & {'auth', 'permission'}:
+            return False
+        if 'hook' in categories and '--no-verify' not in strategy.flags:
+            return False
+        if 'no_upstream' in categories and '--set-upstream' not in strategy.flags:
+            return False
+        if 'diverged' in categories and not strategy.is_destructive:
+            return False
+        return True
+
+    def _backoff_delay(self, attempt: int) -> float:
+        """Capped exponential wait before retrying, with optional jitter"""
+        base = self.config.retry_delay
+        if not self.config.exponential_backoff:
+            return base
+
+        wait_time = min(
+            base * self.config.backoff_base ** attempt, self.config.max_backoff)
+        if self.config.backoff_jitter:
+            wait_time += random.uniform(0, base)
+        return wait_time
+
+    def _within_deadline(self, wait_time: float) -> bool:
+        """Check that another attempt after wait_time still fits the budget"""
+        if self._deadline is None:
+            return True
+        return time.monotonic() + wait_time < self._deadline
 
     def _confirm_destructive_operation(self, strategy: PushStrategy) -> bool:
         """Get user confirmation for destructive operations"""
@@ -539,12 +917,20 @@ class GitPushRetry:
         except Exception:
             pass
 
+        if not sys.stdin.isatty():
+            print(" Non-interactive session - declining destructive operation")
+            return False
+
         print("\n Do you want to proceed?")
-        print("   Type 'YES' (all caps) to confirm:")
+        print(f"   Type 'YES' (all caps) within "
+              f"{self.config.confirmation_timeout}s to confirm:")
 
-        confirmation = input("   > ").strip()
+        confirmation = _timed_input("   > ", self.config.confirmation_timeout)
+        if confirmation is None:
+            print("\n No answer - declining destructive operation")
+            return False
 
-        return confirmation == "YES"
+        return confirmation.strip() == "YES"
 
     def _show_divergence_info(self):
         """Show information about diverged commits"""
@@ -561,13 +947,50 @@ class GitPushRetry:
         except Exception:
             pass
 
+    def _probe_repo(self) -> Dict:
+        """
+        Get repository facts, running git once per push
+
+        Returns:
+            Dict with is_repo, toplevel, git_dir and has_origin
+        """
+        if self._repo_info is None:
+            info = {
+                'is_repo': False,
+                'toplevel': None,
+                'git_dir': None,
+                'has_origin': False
+            }
+            try:
+                result = self.git._run_command(
+                    ['git', 'rev-parse', '--is-inside-work-tree',
+                     '--show-toplevel', '--absolute-git-dir'],
+                    check=False
+                )
+                lines = result.stdout.splitlines()
+                if (result.returncode == 0 and len(lines) == 3
+                        and lines[0] == 'true'):
+                    info['is_repo'] = True
+                    info['toplevel'] = lines[1]
+                    info['git_dir'] = lines[2]
+                    info['has_origin'] = self.git.has_remote('origin')
+            except Exception:
+                pass
+            self._repo_info = info
+        return self._repo_info
+
+    def _git_dir(self) -> str:
+        """Get the repository's Git directory (handles worktrees and submodules)"""
+        return self._probe_repo()['git_dir'] or os.path.join(
+            self._working_dir, '.git')
+
     def _pre_push_checks(self) -> bool:
         """Run pre-push validation checks"""
         print(" Pre-push validation...\n")
 
         checks = [
-            ("Git repository", self.git.is_repo),
-            ("Remote configured", lambda: self.git.has_remote('origin')),
+            ("Git repository", lambda: self._probe_repo()['is_repo']),
+            ("Remote configured", lambda: self._probe_repo()['has_origin']),
             ("Network connectivity", self._check_network_connectivity),
             ("Remote accessibility", self._check_remote_accessibility),
             ("Local changes", self._has_local_changes),
@@ -685,7 +1108,7 @@ class GitPushRetry:
     def _check_remote_accessibility(self) -> bool:
         """Check if remote repository is accessible"""
         try:
-            if not self.git.has_remote('origin'):
+            if not self._probe_repo()['has_origin']:
                 return False
 
             # Try to fetch from remote to check accessibility
@@ -700,11 +1123,7 @@ class GitPushRetry:
         try:
             # Check for staged changes - if no staged changes, check for any
             # changes to prompt user
-            result = self.git._run_command(
-                ['git', 'diff', '--cached', '--quiet'], check=False)
-            # Return True if there are staged changes (return code != 0 means
-            # changes exist)
-            if result.returncode != 0:
+            if self._has_staged_changes():
                 return True
             # If no staged changes, check if there are uncommitted changes
             # (staging needed)
@@ -760,13 +1179,51 @@ class GitPushRetry:
     def _has_changes(self) -> bool:
         """Check if there are uncommitted changes or untracked files"""
         try:
-            # Use fresh Git client to avoid stale state issues
-            fresh_git = get_git_client(working_dir=Path.cwd(), force_new=True)
-            status = fresh_git.status(porcelain=True)
-            return bool(status and status.strip())
+            return bool(self._load_status())
+        except GitCommandError as e:
+            # Only a stale index (e.g. right after lock-file cleanup) is
+            # worth paying for a fresh client
+            if 'index' not in str(e.stderr).lower():
+                return False
+            try:
+                fresh_git = get_git_client(
+                    working_dir=Path(self._working_dir), force_new=True)
+                return bool(fresh_git.status(porcelain=True))
+            except Exception:
+                return False
         except Exception:
             return False
 
+    def _load_status(self) -> List[Tuple[str, str]]:
+        """
+        Get parsed `git status --porcelain -z -uall` entries, running git once
+
+        The result is cached in self._status_cache until staging changes
+        the index. NUL-separated output keeps paths with spaces or quotes
+        intact. Output is read as bytes and only paths are decoded, with
+        os.fsdecode, so names that aren't valid UTF-8 round-trip to git add.
+
+        Returns:
+            List of (two-character status code, path) tuples
+        """
+        if self._status_cache is None:
+            result = self.git._run_command(
+                ['git', 'status', '--porcelain', '-z', '-uall'],
+                check=True, text=False)
+            entries = []
+            fields = iter(result.stdout.split(b'\0'))
+            for field in fields:
+                if len(field) < 4:
+                    continue
+                status_code = field[:2].decode('ascii', errors='replace')
+                entries.append((status_code, os.fsdecode(field[3:])))
+                # Renames and copies (staged, or in the worktree after
+                # `git add -N`) are followed by their original path
+                if 'R' in status_code or 'C' in status_code:
+                    next(fields, None)
+            self._status_cache = entries
+        return self._status_cache
+
     def _stage_and_commit(self, message: str) -> bool:
         """Enhanced staging and commit with smart error handling and auto-fix"""
 
@@ -804,12 +1261,12 @@ class GitPushRetry:
 
         try:
             # Check if we're in a git repo
-            if not self.git.is_repo():
+            if not self._probe_repo()['is_repo']:
                 issues.append("Not in a Git repository")
                 return issues
 
             # CRITICAL: Check for Git lock files first
-            git_dir = Path(self.git.working_dir) / '.git'
+            git_dir = self._git_dir()
             lock_files = self._check_git_lock_files(git_dir)
             if lock_files:
                 for lock_file in lock_files:
@@ -819,8 +1276,8 @@ class GitPushRetry:
 
             # Check git status
             try:
-                status_output = self.git.status(porcelain=True)
-                if not status_output.strip():
+                status_entries = self._load_status()
+                if not status_entries:
                     issues.append("No changes to stage")
                     return issues
             except Exception as e:
@@ -833,29 +1290,27 @@ class GitPushRetry:
                 return issues
 
             # Check for problematic files
-            lines = status_output.strip().split('\n')
-            for line in lines:
-                if len(line) >= 3:
-                    status_code = line[:2]
-                    file_path = line[3:]
-
-                    # Check for binary files that might cause issues
-                    if any(ext in file_path.lower()
-                           for ext in ['.exe', '.dll', '.so', '.dylib']):
-                        issues.append(f"Binary file detected: {file_path}")
-
-                    # Check for very large files
-                    try:
-                        file_obj = Path(self.git.working_dir) / file_path
-                        if file_obj.exists() and file_obj.stat().st_size > 100 * 1024 * 1024:  # 100MB
-                            issues.append(
-                                f"Large file detected (>100MB): {file_path}")
-                    except (OSError, PermissionError, FileNotFoundError):
-                        pass
+            working_dir = self._working_dir
+            for status_code, file_path in status_entries:
+                # Check for binary files that might cause issues
+                if file_path.lower().endswith(_BINARY_EXTENSIONS):
+                    issues.append(f"Binary file detected: {file_path}")
+
+                # Deleted files have nothing on disk to stat
+                if status_code[0] == 'D' or status_code[1] == 'D':
+                    issues.append(f"Deleted file: {file_path}")
+                    continue
 
-                    # Check for deleted files
-                    if status_code[0] == 'D' or status_code[1] == 'D':
-                        issues.append(f"Deleted file: {file_path}")
+                # Check for very large files (one stat, no Path objects)
+                try:
+                    file_size = os.stat(
+                        os.path.join(working_dir, file_path),
+                        follow_symlinks=False).st_size
+                except OSError:
+                    continue
+                if file_size > _LARGE_FILE_BYTES:
+                    issues.append(
+                        f"Large file detected (>100MB): {file_path}")
 
         except Exception as e:
             if "index.lock" in str(e).lower(
@@ -866,34 +1321,22 @@ class GitPushRetry:
 
         return issues
 
-    def _check_git_lock_files(self, git_dir: Path) -> List[str]:
+    def _check_git_lock_files(self, git_dir: str) -> List[str]:
         """Check for Git lock files that prevent operations"""
         lock_files = []
 
-        try:
-            # Common Git lock files
-            potential_locks = [
-                'index.lock',
-                'HEAD.lock',
-                'refs/heads/main.lock',
-                'refs/heads/master.lock',
-                'config.lock',
-                'packed-refs.lock'
-            ]
-
-            for lock_file in potential_locks:
-                lock_path = git_dir / lock_file
-                if lock_path.exists():
-                    lock_files.append(str(lock_path))
-
-            # Check for branch-specific locks
-            refs_heads = git_dir / 'refs' / 'heads'
-            if refs_heads.exists():
-                for branch_file in refs_heads.glob('*.lock'):
-                    lock_files.append(str(branch_file))
-
-        except Exception:
-            pass
+        # One scandir of .git catches index/HEAD/config/packed-refs and any
+        # other top-level lock (ORIG_HEAD.lock, FETCH_HEAD.lock, ...); a
+        # second one covers branch-specific locks. DirEntry names come
+        # straight from readdir, so no per-file stat is needed.
+        for directory in (git_dir, os.path.join(git_dir, 'refs', 'heads')):
+            try:
+                with os.scandir(directory) as entries:
+                    lock_files.extend(
+                        entry.path for entry in entries
+                        if entry.name.endswith('.lock'))
+            except OSError:
+                pass
 
         return lock_files
 
@@ -914,44 +1357,31 @@ class GitPushRetry:
     def _fix_git_lock_files(self) -> bool:
         """Fix Git lock file issues by safely removing lock files"""
         try:
-            git_dir = Path(self.git.working_dir) / '.git'
+            git_dir = self._git_dir()
             lock_files = self._check_git_lock_files(git_dir)
 
             if not lock_files:
                 return True  # No lock files to fix
 
-            print(f"    Found {len(lock_files)} lock file(s) to remove:")
-
             removed_count = 0
+            errors = []
             for lock_file_path in lock_files:
+                # Safety check: ensure it's actually a lock file
+                if not lock_file_path.endswith('.lock'):
+                    continue
                 try:
-                    lock_path = Path(lock_file_path)
-
-                    # Safety check: ensure it's actually a lock file
-                    if lock_path.name.endswith('.lock') and lock_path.exists():
-                        print(f"      • Removing: {lock_path.name}")
+                    os.unlink(lock_file_path)
+                    removed_count += 1
+                except FileNotFoundError:
+                    removed_count += 1  # Released while we were looking
+                except OSError as e:
+                    errors.append((lock_file_path, e))
 
-                        # Try to remove the lock file
-                        lock_path.unlink()
-                        removed_count += 1
-
-                        # Verify it's actually gone
-                        if not lock_path.exists():
-                            print(
-                                f"         Successfully removed {lock_path.name}")
-                        else:
-                            print(
-                                f"         Failed to remove {lock_path.name}")
-
-                except Exception as e:
-                    print(f"       Error removing {lock_file_path}: {e}")
+            for lock_file_path, error in errors:
+                print(f"       Error removing {lock_file_path}: {error}")
 
             if removed_count > 0:
-                print(f"    Successfully removed {removed_count} lock file(s)")
-
-                # Wait a moment for filesystem to catch up
-                import time
-                time.sleep(0.5)
+                print(f"    Removed {removed_count} of {len(lock_files)} lock file(s)")
 
                 # Verify Git operations work now
                 try:
@@ -971,9 +1401,9 @@ class GitPushRetry:
 
     def _provide_manual_fix_guidance(self, issues: List[str]) -> None:
         """Provide manual fix guidance for remaining issues"""
-        print("\n" + "=" * 60)
+        print("\n" + _BANNER60)
         print(" MANUAL FIX REQUIRED")
-        print("=" * 60)
+        print(_BANNER60)
 
         lock_file_issues = [
             issue for issue in issues if "lock file" in issue.lower()]
@@ -986,7 +1416,7 @@ class GitPushRetry:
             print("   3. Wait for any background Git processes to complete")
             print("   4. Manually remove lock files:")
 
-            git_dir = Path(self.git.working_dir) / '.git'
+            git_dir = self._git_dir()
             lock_files = self._check_git_lock_files(git_dir)
             for lock_file in lock_files:
                 print(f"      rm \"{lock_file}\"")
@@ -998,24 +1428,15 @@ class GitPushRetry:
             print("   Windows: del \".git\\index.lock\" 2>nul")
             print("   Linux/Mac: rm -f .git/index.lock")
 
-        print("\n" + "=" * 60)
+        print("\n" + _BANNER60)
 
     def _handle_gitignore_changes(self) -> bool:
         """Handle .gitignore changes by removing previously tracked files that now match ignore patterns"""
         try:
             # Check if .gitignore has been modified or is new
-            status_output = self.git.status(porcelain=True)
-            gitignore_modified = False
-
-            if status_output:
-                lines = status_output.strip().split('\n')
-                for line in lines:
-                    if len(line) >= 3:
-                        file_path = line[3:]
-                        if file_path == '.gitignore' or file_path.endswith(
-                                '/.gitignore'):
-                            gitignore_modified = True
-                            break
+            gitignore_modified = any(
+                file_path == '.gitignore' or file_path.endswith('/.gitignore')
+                for _, file_path in self._load_status())
 
             if not gitignore_modified:
                 return True  # No .gitignore changes, continue normally
@@ -1059,6 +1480,9 @@ class GitPushRetry:
             if not files_to_remove:
                 return True  # No files to remove
 
+            # git rm --cached below rewrites the index
+            self._status_cache = None
+
             # Check if auto-handling is enabled
             if self.config.auto_handle_gitignore:
                 # Auto-remove files from tracking
@@ -1145,14 +1569,16 @@ class GitPushRetry:
 
     def _smart_stage_changes(self) -> bool:
         """Smart staging with multiple fallback strategies"""
-        strategies = [
-            ("Standard staging", self._stage_standard),
-            ("Interactive staging", self._stage_interactive),
-            ("Individual file staging", self._stage_individual_files),
-            ("Force staging", self._stage_force)
-        ]
+        if self._nothing_to_stage():
+            return True
+
+        print(" Trying standard staging...")
+        if self._stage_standard():
+            print(" Standard staging successful\n")
+            return True
+        print("  Standard staging had issues, trying next strategy...\n")
 
-        for strategy_name, strategy_func in strategies:
+        for strategy_name, strategy_func in self._staging_fallbacks():
             try:
                 print(f" Trying {strategy_name.lower()}...")
                 if strategy_func():
@@ -1171,14 +1597,10 @@ class GitPushRetry:
 
     def _smart_stage_changes_quiet(self) -> bool:
         """Smart staging with multiple fallback strategies (quiet mode)"""
-        strategies = [
-            self._stage_standard,
-            self._stage_interactive,
-            self._stage_individual_files,
-            self._stage_force
-        ]
+        if self._nothing_to_stage() or self._stage_standard():
+            return True
 
-        for strategy_func in strategies:
+        for _, strategy_func in self._staging_fallbacks():
             try:
                 if strategy_func():
                     return True
@@ -1187,42 +1609,67 @@ class GitPushRetry:
 
         return False
 
+    def _nothing_to_stage(self) -> bool:
+        """Check whether status is clean, so no staging pass is needed"""
+        try:
+            return not self._load_status()
+        except Exception:
+            return False
+
+    def _staging_fallbacks(self) -> List[Tuple[str, Callable[[], bool]]]:
+        """
+        Pick staging fallbacks based on why `git add .` failed
+
+        A held index.lock defeats every other strategy too, so the lock is
+        cleared and standard staging retried instead. A bad pathspec goes
+        straight to per-file staging, which isolates the offending path.
+        """
+        error = self._last_staging_error
+        error_msg = ''
+        if error is not None:
+            error_msg = f"{error} {getattr(error, 'stderr', '') or ''}"
+
+        if 'index.lock' in error_msg:
+            return [("Lock file recovery", self._stage_after_lock_fix)]
+        if 'pathspec' in error_msg:
+            return [("Individual file staging", self._stage_individual_files)]
+
+        return [
+            ("Interactive staging", self._stage_interactive),
+            ("Individual file staging", self._stage_individual_files),
+            ("Force staging", self._stage_force)
+        ]
+
     def _stage_standard(self) -> bool:
         """Standard git add . staging"""
         try:
             self.git.add()
+            self._status_cache = None
+            self._last_staging_error = None
             return True
-        except Exception:
+        except Exception as e:
+            self._last_staging_error = e
             return False
 
+    def _stage_after_lock_fix(self) -> bool:
+        """Remove stale lock files, then retry standard staging once"""
+        return self._fix_git_lock_files() and self._stage_standard()
+
     def _stage_interactive(self) -> bool:
         """Interactive staging to handle problematic files"""
         try:
             # Get list of changed files
-            status_output = self.git.status(porcelain=True)
-            if not status_output.strip():
+            file_paths = [file_path for _, file_path in self._load_status()]
+            if not file_paths:
                 return False
 
-            # Stage files one by one, skipping problematic ones
-            lines = status_output.strip().split('\n')
-            staged_count = 0
+            # Stage files in batches, skipping problematic ones
+            staged_files, failed_files = self._git_add_batch(file_paths)
 
-            for line in lines:
-                if len(line) >= 3:
-                    file_path = line[3:]
-                    try:
-                        # Try to stage individual file
-                        result = self.git._run_command(
-                            ['git', 'add', file_path], check=False)
-                        if result.returncode == 0:
-                            staged_count += 1
-                        else:
-                            print(
-                                f"     Skipped problematic file: {file_path}")
-                    except (subprocess.CalledProcessError, OSError, PermissionError):
-                        print(f"     Skipped problematic file: {file_path}")
+            for file_path, _ in failed_files:
+                print(f"     Skipped problematic file: {file_path}")
 
-            return staged_count > 0
+            return len(staged_files) > 0
 
         except Exception:
             return False
@@ -1230,35 +1677,23 @@ class GitPushRetry:
     def _stage_individual_files(self) -> bool:
         """Stage files individually with detailed error reporting"""
         try:
-            status_output = self.git.status(porcelain=True)
-            if not status_output.strip():
+            status_entries = self._load_status()
+            if not status_entries:
                 return False
 
-            lines = status_output.strip().split('\n')
-            successful_files = []
+            to_stage = []
             failed_files = []
 
-            for line in lines:
-                if len(line) >= 3:
-                    file_path = line[3:]
-                    try:
-                        # Check if file exists
-                        full_path = Path(self.git.working_dir) / file_path
-                        if not full_path.exists() and line[0] != 'D':
-                            failed_files.append((file_path, "File not found"))
-                            continue
-
-                        # Try to add the file
-                        result = self.git._run_command(
-                            ['git', 'add', file_path], check=False)
-                        if result.returncode == 0:
-                            successful_files.append(file_path)
-                        else:
-                            failed_files.append(
-                                (file_path, result.stderr.strip()))
+            for status_code, file_path in status_entries:
+                # Check if file exists
+                full_path = os.path.join(self._working_dir, file_path)
+                if not os.path.lexists(full_path) and status_code[0] != 'D':
+                    failed_files.append((file_path, "File not found"))
+                    continue
+                to_stage.append(file_path)
 
-                    except Exception as e:
-                        failed_files.append((file_path, str(e)))
+            successful_files, add_failures = self._git_add_batch(to_stage)
+            failed_files.extend(add_failures)
 
             if successful_files:
                 print(f"    Successfully staged {len(successful_files)} files")
@@ -1276,21 +1711,84 @@ class GitPushRetry:
         except Exception:
             return False
 
+    def _git_add_batch(
+        self,
+        file_paths: List[str]
+    ) -> Tuple[List[str], List[Tuple[str, str]]]:
+        """
+        Stage files with as few `git add` calls as possible
+
+        Paths are added in chunks of _ADD_BATCH_SIZE. `git add` stages
+        nothing when any path in a chunk fails, so a failed chunk is split
+        in half and retried until the offending paths are isolated.
+
+        Args:
+            file_paths: Paths to stage, relative to the working directory
+
+        Returns:
+            Tuple of (staged paths, list of (failed path, error message))
+        """
+        staged = []
+        failed = []
+        pending = [file_paths[i:i + _ADD_BATCH_SIZE]
+                   for i in range(0, len(file_paths), _ADD_BATCH_SIZE)]
+        pending.reverse()
+
+        while pending:
+            batch = pending.pop()
+            try:
+                result = self.git._run_command(
+                    ['git', 'add', '--'] + batch, check=False)
+                error = None if result.returncode == 0 else result.stderr.strip()
+            except Exception as e:
+                error = str(e)
+
+            if error is None:
+                staged.extend(batch)
+            elif len(batch) == 1:
+                failed.append((batch[0], error))
+            else:
+                middle = len(batch) // 2
+                # Push the second half first so the first half runs next
+                pending.append(batch[middle:])
+                pending.append(batch[:middle])
+
+        if staged:
+            self._status_cache = None
+
+        return staged, failed
+
     def _stage_force(self) -> bool:
         """Force staging with git add -A"""
         try:
             result = self.git._run_command(['git', 'add', '-A'], check=False)
-            return result.returncode == 0
+            if result.returncode == 0:
+                self._status_cache = None
+                return True
+            return False
         except Exception:
             return False
 
+    def _has_staged_changes(self) -> bool:
+        """
+        Check whether the index differs from HEAD
+
+        `git diff-index --cached --quiet HEAD` compares the index against the
+        HEAD tree without running the diff machinery. Before the first
+        commit there is no HEAD, so `git diff --cached` answers instead.
+        """
+        result = self.git._run_command(
+            ['git', 'diff-index', '--cached', '--quiet', 'HEAD'], check=False)
+        if result.returncode not in (0, 1):
+            result = self.git._run_command(
+                ['git', 'diff', '--cached', '--quiet'], check=False)
+        return result.returncode != 0
+
     def _smart_commit(self, message: str) -> bool:
         """Smart commit with validation"""
         try:
             # Check if there are staged changes
-            result = self.git._run_command(
-                ['git', 'diff', '--cached', '--quiet'], check=False)
-            if result.returncode == 0:
+            if not self._has_staged_changes():
                 print("  No staged changes to commit")
                 return False
 
@@ -1308,9 +1806,7 @@ class GitPushRetry:
         """Smart commit with validation (quiet mode)"""
         try:
             # Check if there are staged changes
-            result = self.git._run_command(
-                ['git', 'diff', '--cached', '--quiet'], check=False)
-            if result.returncode == 0:
+            if not self._has_staged_changes():
                 return False
 
             self.git.commit(message)
@@ -1321,74 +1817,15 @@ class GitPushRetry:
 
     def _provide_staging_guidance(self) -> None:
         """Provide guidance when staging fails"""
-        print("\n Staging Troubleshooting Guide:")
-        print("   1. Check if you're in a Git repository: git status")
-        print("   2. Check for file permission issues")
-        print("   3. Look for large files or binary files that might be problematic")
-        print("   4. Try staging files individually: git add <filename>")
-        print("   5. Check .gitignore for conflicting patterns")
-        print("   6. Verify file paths don't contain special characters")
-        print()
+        sys.stdout.write(_STAGING_GUIDE)
 
     def _provide_commit_guidance(self) -> None:
         """Provide guidance when commit fails"""
-        print("\n Commit Troubleshooting Guide:")
-        print("   1. Ensure you have staged changes: git status")
-        print("   2. Check commit message length and characters")
-        print("   3. Verify Git user configuration: git config user.name/user.email")
-        print("   4. Try with a simpler commit message")
-        print()
+        sys.stdout.write(_COMMIT_GUIDE)
 
     def _provide_push_failure_guidance(self) -> None:
         """Provide comprehensive guidance when push fails completely"""
-        print("\n" + "=" * 60)
-        print(" PUSH FAILURE DIAGNOSTIC & SOLUTIONS")
-        print("=" * 60)
-
-        print("\n Common Push Failure Causes & Solutions:")
-
-        print("\n1.  NETWORK/CONNECTIVITY ISSUES:")
-        print("   • Check internet connection")
-        print("   • Verify remote URL: git remote -v")
-        print("   • Test connectivity: git ls-remote origin")
-        print("   • Try with different network or VPN")
-
-        print("\n2.  AUTHENTICATION ISSUES:")
-        print("   • Check Git credentials: git config --list")
-        print("   • Update GitHub token/SSH key")
-        print("   • Run: git credential-manager-core erase")
-        print("   • Re-authenticate: git push (will prompt)")
-
-        print("\n3.  REPOSITORY STATE ISSUES:")
-        print("   • Check repo status: git status")
-        print("   • View recent commits: git log --oneline -5")
-        print("   • Check branch tracking: git branch -vv")
-        print("   • Ensure branch exists on remote")
-
-        print("\n4.  PERMISSION ISSUES:")
-        print("   • Verify you have push access to the repository")
-        print("   • Check if branch is protected")
-        print("   • Ensure you're pushing to correct remote/branch")
-
-        print("\n5.  REPOSITORY SIZE ISSUES:")
-        print("   • Check for large files: git ls-files | xargs ls -la")
-        print("   • Use Git LFS for large files")
-        print("   • Consider splitting large commits")
-
-        print("\n IMMEDIATE TROUBLESHOOTING STEPS:")
-        print("   1. Run: git status (check current state)")
-        print("   2. Run: git remote -v (verify remote URL)")
-        print("   3. Run: git branch -vv (check branch tracking)")
-        print("   4. Run: git push --verbose (detailed push output)")
-        print("   5. Try: git push --force-with-lease (if safe)")
-
-        print("\n ALTERNATIVE APPROACHES:")
-        print("   • Create new branch: git checkout -b new-feature")
-        print("   • Reset and retry: git reset --soft HEAD~1")
-        print("   • Manual push: git push origin <branch-name>")
-        print("   • Use GitHub CLI: gh repo sync")
-
-        print("\n" + "=" * 60)
+        sys.stdout.write(_PUSH_FAILURE_GUIDE)
 
     def _show_push_summary(self):
         """Show visually appealing summary after successful push"""
@@ -1397,27 +1834,54 @@ class GitPushRetry:
             from colorama import Fore, Style, init
             init()
 
-            print("\n" + "=" * 70)
+            print("\n" + _BANNER70)
             print(f"{Fore.GREEN}{'PUSH SUCCESSFUL!':^70}{Style.RESET_ALL}")
-            print("=" * 70)
+            print(_BANNER70)
+
+            # Diffing the commit is the slowest query; overlap it with the rest
+            stat_result = self._run_in_background(
+                ['git', 'show', '--stat', '--format=', 'HEAD'])
 
             # Get latest commit info using safer commands
             self._show_latest_commit_info()
 
             # Get diff statistics for the pushed commit
-            self._show_commit_statistics()
+            self._show_commit_statistics(stat_result)
 
             # Get repository status
             self._show_repository_status()
 
-            print("\n" + "=" * 70)
+            print("\n" + _BANNER70)
             print(
                 f"{Fore.GREEN}{'All changes pushed successfully!':^70}{Style.RESET_ALL}")
-            print("=" * 70 + "\n")
+            print(_BANNER70 + "\n")
 
         except Exception as e:
             print(f"  Could not generate full summary: {e}")
 
+    def _run_in_background(
+        self, cmd: List[str]
+    ) -> Callable[[], subprocess.CompletedProcess]:
+        """Start a Git command on a worker thread and return a getter for its result"""
+        outcome = {}
+
+        def run():
+            try:
+                outcome['result'] = self.git._run_command(cmd, check=False)
+            except Exception as e:
+                outcome['error'] = e
+
+        thread = threading.Thread(target=run, daemon=True)
+        thread.start()
+
+        def result() -> subprocess.CompletedProcess:
+            thread.join()
+            if 'error' in outcome:
+                raise outcome['error']
+            return outcome['result']
+
+        return result
+
     def _show_latest_commit_info(self):
         """Show latest commit information using safe git commands"""
         try:
@@ -1461,7 +1925,10 @@ class GitPushRetry:
         except Exception as e:
             print(f"    Could not retrieve commit details: {e}")
 
-    def _show_commit_statistics(self):
+    def _show_commit_statistics(
+        self,
+        stat_result: Optional[Callable[[], subprocess.CompletedProcess]] = None
+    ):
         """Show comprehensive file change statistics with beautiful design"""
         try:
             # Import colorama for colors
@@ -1469,16 +1936,19 @@ class GitPushRetry:
             init()
 
             # Get statistics for the latest commit
-            result = self.git._run_command(
-                ['git', 'show', '--stat', '--format=', 'HEAD'],
-                check=False
-            )
+            if stat_result is not None:
+                result = stat_result()
+            else:
+                result = self.git._run_command(
+                    ['git', 'show', '--stat', '--format=', 'HEAD'],
+                    check=False
+                )
 
             if result.returncode == 0 and result.stdout.strip():
                 # Create a beautiful header
                 print(
                     f"\n{Fore.YELLOW}{'📊 COMPREHENSIVE COMMIT STATISTICS':^78}{Style.RESET_ALL}")
-                print("=" * 78)
+                print(_BANNER78)
 
                 stats_lines = result.stdout.strip().split('\n')
                 file_changes = []
@@ -1545,7 +2015,7 @@ class GitPushRetry:
 
                 # Display detailed file changes if any
                 if file_changes:
-                    print("\n" + "=" * 78)
+                    print("\n" + _BANNER78)
                     print(
                         f"{Fore.MAGENTA}{'📋 DETAILED FILE CHANGES':^78}{Style.RESET_ALL}")
                     print("-" * 78)
@@ -1598,7 +2068,7 @@ class GitPushRetry:
                             f"  {'... and ' + str(len(file_changes) - 15) + ' more files':^78}")
 
                 # Footer with summary
-                print("\n" + "=" * 78)
+                print("\n" + _BANNER78)
                 if summary_line and match:
                     print(
                         f"{'Total: ' + str(total_changes) + ' lines changed across ' + str(files_changed) + ' file(s)':^78}")
@@ -1626,23 +2096,23 @@ class GitPushRetry:
             # Create a simple header for statistics
             print(
                 f"\n{Fore.YELLOW}{'📊 COMPREHENSIVE COMMIT STATISTICS':^78}{Style.RESET_ALL}")
-            print("=" * 78)
+            print(_BANNER78)
 
             if result.returncode == 0 and result.stdout.strip():
                 lines = result.stdout.strip().split('\n')
                 for line in lines:
                     if line.strip() and not line.startswith(' '):
                         print(f"  {line}")
-                print("=" * 78)
+                print(_BANNER78)
             else:
                 print(f"  {'Detailed statistics not available':^78}")
-                print("=" * 78)
+                print(_BANNER78)
         except Exception:
             print(
                 f"\n{Fore.YELLOW}{'📊 COMPREHENSIVE COMMIT STATISTICS':^78}{Style.RESET_ALL}")
-            print("=" * 78)
+            print(_BANNER78)
             print(f"  {'Statistics not available':^78}")
-            print("=" * 78)
+            print(_BANNER78)
 
     def _show_repository_status(self):
         """Show current repository status"""
@@ -1704,7 +2174,13 @@ class GitPushRetry:
 
     def _show_failure_guidance(self, last_error: Optional[Exception]):
         """Show minimal guidance when all strategies fail"""
-        print("\n Push failed. Check network connection and repository permissions.")
+        categories = self._classify_error(last_error)
+        if categories & {'auth', 'permission'}:
+            print("\n Push failed. Check your credentials and write access to the repository.")
+        elif 'network' in categories:
+            print("\n Push failed. Check your network connection and try again.")
+        else:
+            print("\n Push failed. Check network connection and repository permissions.")
         if last_error:
             print(f" Last error: {str(last_error)[:100]}...")
         input("\nPress Enter to continue...")
@@ -1714,14 +2190,7 @@ class GitPushRetry:
         if not stderr:
             return "Unknown error"
 
-        lines = [l.strip() for l in stderr.split('\n') if l.strip()]
-        error_lines = [l for l in lines if l.startswith(
-            '!') or 'error' in l.lower()]
-
-        if error_lines:
-            return error_lines[0][:100]
-
-        return lines[0][:100] if lines else "Unknown error"
+        return _summarize_stderr(stderr)
 
     def _check_for_potential_conflicts_internal(self):
         """Check for potential conflicts before pushing and provide guidance"""
@@ -1788,28 +2257,17 @@ class GitPush:
         Args:
             dry_run: Show what would be done without executing
         """
-        print("\n" + "=" * 70)
+        print("\n" + _BANNER70)
         print("  GIT PUSH (With Auto-Retry & Auto-Changelog)")
-        print("=" * 70 + "\n")
+        print(_BANNER70 + "\n")
 
         # IMPORTANT: Refresh Git client to avoid stale state
         # This prevents the "nothing to commit" bug that requires restarting
         print(" Refreshing Git state...")
-        self.git = get_git_client(working_dir=Path.cwd(), force_new=True)
-        self.push_retry.git = get_git_client(
-            working_dir=Path.cwd(), force_new=True)
+        self.git = _cached_git_client(self.current_dir)
+        self.push_retry._use_git_client(self.git)
 
-        # Also refresh the Git index to ensure we see all filesystem changes
-        try:
-            from ..core.security import SecurityValidator
-            SecurityValidator.safe_subprocess_run(
-                ['git', 'status'],
-                capture_output=True, cwd=Path.cwd(),
-                timeout=5)
-        except (subprocess.CalledProcessError, OSError, TimeoutError, ImportError):
-            pass  # Not critical if this fails
-
-        # Check for changes
+        # Check for changes (git status also refreshes the index's stat info)
         if not self._has_changes():
             print("ℹ  No changes detected. Working directory is clean.")
             print("\n This includes:")
@@ -1820,8 +2278,8 @@ class GitPush:
             input("\nPress Enter to continue...")
             return
 
-        # Show changes summary
-        self._show_changes_summary()
+        # Show changes summary from the status _has_changes just parsed
+        self._show_changes_summary(self.push_retry._load_status())
 
         if dry_run:
             print("\n DRY RUN - No changes will be made")
@@ -1847,6 +2305,9 @@ class GitPush:
             if not success:
                 print("  Push failed after all retry attempts")
 
+        # Keep changelog output above the prompt
+        self.push_retry.wait_changelog()
+
         input("\nPress Enter to continue...")
 
     def _handle_multiple_sequential_commits(self):
@@ -1857,9 +2318,9 @@ class GitPush:
         total_commits = len(self._pending_commits)
         committed_count = 0
         
-        print(f"\n{'='*70}")
+        print("\n" + _BANNER70)
         print(f"  COMMITTING {total_commits} LOGICAL CHANGES SEQUENTIALLY")
-        print(f"{'='*70}\n")
+        print(_BANNER70 + "\n")
         
         # Reset index to start from beginning
         self._current_commit_index = 0
@@ -1906,9 +2367,9 @@ class GitPush:
             
             self._current_commit_index += 1
         
-        print(f"\n{'='*70}")
+        print("\n" + _BANNER70)
         print(f"  SUMMARY: {committed_count}/{total_commits} commits completed")
-        print(f"{'='*70}\n")
+        print(_BANNER70 + "\n")
         
         # Clean up
         if hasattr(self, '_pending_commits'):
@@ -1917,121 +2378,75 @@ class GitPush:
             del self._current_commit_index
 
     def _has_changes(self) -> bool:
-        """Check if there are any changes including untracked files with fresh Git client"""
-        try:
-            # IMPORTANT: Create a fresh Git client instance to avoid stale state
-            # This prevents the "nothing to commit" bug when files have changed
-            fresh_git = get_git_client(working_dir=Path.cwd(), force_new=True)
-
-            # Force refresh by running git status twice with different methods
-            # First check with the fresh client
-            status = fresh_git.status(porcelain=True)
-            has_changes = bool(status and status.strip())
-
-            # If no changes detected, try a direct subprocess call as fallback
-            # This bypasses any potential caching issues
-            if not has_changes:
-                print(" Double-checking for changes with direct Git command...")
-                from ..core.security import SecurityValidator
-                result = SecurityValidator.safe_subprocess_run(
-                    ['git', 'status', '--porcelain', '--untracked-files=all'],
-                    capture_output=True,
-                    text=True,
-                    cwd=self.current_dir,
-                    timeout=10
-                )
-                if result.stdout.strip():
-                    print(f" Found changes via direct Git command:")
-                    lines = result.stdout.strip().split('\n')
-                    for line in lines[:5]:  # Show first 5 changes
-                        print(f"   {line}")
-                    if len(lines) > 5:
-                        print(f"   ... and {len(lines) - 5} more")
-                    return True
-
-            # Also check for staged changes that might not show in porcelain
-            if not has_changes:
-                staged_result = SecurityValidator.safe_subprocess_run(
-                    ['git', 'diff', '--cached', '--name-only'],
-                    capture_output=True,
-                    text=True,
-                    cwd=self.current_dir,
-                    timeout=10
-                )
-                if staged_result.stdout.strip():
-                    print(" Found staged changes:")
-                    staged_files = staged_result.stdout.strip().split('\n')
-                    for file in staged_files[:5]:
-                        print(f"   staged: {file}")
-                    return True
-
-            return has_changes
+        """
+        Check for staged, unstaged or untracked changes
 
+        One `git status --porcelain -z` covers all three (staged changes are
+        the first column of each entry). The parsed result is kept by the
+        push helper, so later steps of this push reuse it until staging
+        changes the index.
+        """
+        try:
+            return bool(self.push_retry._load_status())
         except Exception as e:
             print(f"  Error checking for changes: {e}")
-            # In case of error, be conservative and assume there might be
-            # changes
-            print(" Attempting direct git status as fallback...")
-            try:
-                fallback_result = SecurityValidator.safe_subprocess_run(
-                    ['git', 'status', '--porcelain'],
-                    capture_output=True,
-                    text=True,
-                    cwd=self.current_dir,
-                    timeout=5
-                )
-                return bool(fallback_result.stdout.strip())
-            except (subprocess.CalledProcessError, OSError, TimeoutError):
-                print("  All change detection methods failed")
-                return False
+            return False
+
+    def _show_changes_summary(self, status_entries: List[Tuple[str, str]]):
+        """
+        Display detailed summary of all changes
 
-    def _show_changes_summary(self):
-        """Display detailed summary of all changes"""
+        Args:
+            status_entries: Parsed (status code, path) porcelain entries
+        """
         print(" Changes to be committed:\n")
 
         try:
-            status = self.git.status(porcelain=True)
-
-            if not status or not status.strip():
+            if not status_entries:
                 print("  (none)")
                 return
 
-            lines = [l for l in status.split('\n') if l.strip()]
+            lines = status_entries
 
-            untracked = [l for l in lines if l.startswith('??')]
-            new_files = [l for l in lines if l.startswith('A ')]
-            modified = [l for l in lines if ' M' in l[:2] or l.startswith('M')]
-            deleted = [l for l in lines if ' D' in l[:2] or l.startswith('D')]
+            # One pass over the entries; a code such as 'MD' counts as both
+            # modified and deleted
+            untracked = new_files = modified = deleted = 0
+            for status_code, _ in lines:
+                if status_code == '??':
+                    untracked += 1
+                elif status_code == 'A ':
+                    new_files += 1
+                else:
+                    if status_code[0] == 'M' or status_code == ' M':
+                        modified += 1
+                    if status_code[0] == 'D' or status_code == ' D':
+                        deleted += 1
 
             if untracked:
-                print(f"   Untracked files: {len(untracked)}")
+                print(f"   Untracked files: {untracked}")
             if new_files:
-                print(f"   New files (staged): {len(new_files)}")
+                print(f"   New files (staged): {new_files}")
             if modified:
-                print(f"   Modified: {len(modified)}")
+                print(f"   Modified: {modified}")
             if deleted:
-                print(f"   Deleted: {len(deleted)}")
+                print(f"   Deleted: {deleted}")
 
             if len(lines) > 0:
-                print("\n  Files:")
-                for line in lines[:15]:
-                    status_code = line[:2]
-                    filename = line[3:].strip() if len(
-                        line) > 3 else line[2:].strip()
-
-                    if status_code == '??':
-                        print(f"    ?? (untracked) {filename}")
-                    elif status_code == 'A ':
-                        print(f"    A  (new)       {filename}")
-                    elif 'M' in status_code:
-                        print(f"    M  (modified)  {filename}")
-                    elif 'D' in status_code:
-                        print(f"    D  (deleted)   {filename}")
-                    else:
-                        print(f"    {status_code} {filename}")
+                out = ["\n  Files:"]
+                for status_code, filename in lines[:15]:
+                    label = _STATUS_LABELS.get(status_code)
+                    if label is None:
+                        if 'M' in status_code:
+                            label = _STATUS_LABELS[' M']
+                        elif 'D' in status_code:
+                            label = _STATUS_LABELS[' D']
+                        else:
+                            label = f"{status_code} "
+                    out.append(f"    {label}{filename}")
 
                 if len(lines) > 15:
-                    print(f"    ... and {len(lines) - 15} more files")
+                    out.append(f"    ... and {len(lines) - 15} more files")
+                print("\n".join(out))
 
             print()
 
@@ -2096,22 +2511,7 @@ class GitPush:
             generator = GroqCommitGenerator()
 
             # Get git config
-            username = "<default_username>"
-            email = "<default_email>"
-
-            try:
-                user_result = self.git._run_command(['git', 'config', 'user.name'], check=False)
-                if user_result.returncode == 0 and user_result.stdout.strip():
-                    username = user_result.stdout.strip()
-            except Exception:
-                pass
-
-            try:
-                email_result = self.git._run_command(['git', 'config', 'user.email'], check=False)
-                if email_result.returncode == 0 and email_result.stdout.strip():
-                    email = email_result.stdout.strip()
-            except Exception:
-                pass
+            username, email = _git_user_identity(self.git)
 
             # Analyze all changes with loading animation
             changes_info = None
@@ -2171,7 +2571,7 @@ if __name__ == "__main__":
     for i, s in enumerate(config.strategies, 1):
         print(f"  {i}. {s.name}: {s.description}")
 
-    print("\n" + "=" * 70)
+    print("\n" + _BANNER70)
     print("Ready to use! Import and call:")
     print("  from src.github.git_push import GitPush")
     print("  pusher = GitPush()")
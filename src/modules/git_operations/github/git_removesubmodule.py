@@ -5,12 +5,70 @@ Handles detection and management of nested repositories/submodules
 
 import os
 import subprocess
+import sys
 import json
-from typing import List, Tuple, Optional
-from core.loading import LoadingSpinner
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from typing import Dict, Iterator, List, Tuple, Optional
+from core.loading import LoadingSpinner, loading_context
 from core.utils.exceptions import GitError
 from core.menu import Menu, MenuItem
 
+# Tool caches, virtualenvs and build output never hold repositories worth
+# managing, but can dwarf the rest of the tree; the scan never enters them
+_SKIP_DIRS = frozenset({
+    "node_modules", "__pycache__", ".venv", "venv", ".tox",
+    ".mypy_cache", ".pytest_cache", ".idea", "dist", "build", "target",
+})
+
+# Upper bound on threads walking top-level directories concurrently
+_SCAN_WORKERS = min(32, (os.cpu_count() or 1) * 4)
+
+
+def _list_directory(
+        path: str) -> Optional[Tuple[bool, bool, List[Tuple[str, str]]]]:
+    """
+    Read one directory for the repository scan
+
+    The DirEntry type comes from the directory read itself, so no entry
+    needs a stat of its own; symlinked directories are not followed.
+
+    Returns:
+        (has_git, has_git_disable, [(subdir_path, subdir_name)]), or None
+        if the directory cannot be read
+    """
+    subdirs = []
+    has_git = has_git_disable = False
+
+    try:
+        with os.scandir(path) as entries:
+            for entry in entries:
+                name = entry.name
+                if name == ".git":
+                    has_git = entry.is_dir()
+                elif name == ".git_disable":
+                    has_git_disable = entry.is_dir()
+                elif (name not in _SKIP_DIRS
+                      and entry.is_dir(follow_symlinks=False)):
+                    subdirs.append((entry.path, name))
+    except OSError:
+        # Unreadable directories are skipped, as os.walk did
+        return None
+
+    return has_git, has_git_disable, subdirs
+
+
+def _truncate_path(path: str, max_length: int = 50) -> str:
+    """Keep the end of a long path, which is the part that identifies it"""
+    if len(path) <= max_length:
+        return path
+    return "..." + path[-(max_length - 3):]
+
+
+def _decode_output(output: bytes) -> str:
+    """Decode git output; only needed when an error is shown"""
+    return output.decode("utf-8", errors="replace")
+
 
 class GitRemoveSubmodule:
     """Handles detection and management of nested repositories/submodules"""
@@ -18,18 +76,23 @@ class GitRemoveSubmodule:
     def __init__(self):
         # (folder_name, full_path)
         self.nested_repos: List[Tuple[str, str]] = []
-        # Track disabled repos for recovery
-        self.disabled_repos: List[Tuple[str, str]] = []
+        # Track disabled repos for recovery (full_path -> folder_name)
+        self.disabled_repos: Dict[str, str] = {}
         self.state_file = ".submodule_state.json"  # File to persist state
+        # Prefix stripped from absolute paths to make them cwd-relative
+        self._cwd_prefix = os.path.join(os.getcwd(), "")
         self.load_state()
 
     def scan_all_repositories(
-            self, base_path: str = ".") -> Tuple[List[Tuple[str, str]], List[Tuple[str, str]]]:
+            self, base_path: str = ".",
+            spinner: Optional[LoadingSpinner] = None
+    ) -> Tuple[List[Tuple[str, str]], List[Tuple[str, str]]]:
         """
         Fast scan for both active (.git) and disabled (.git_disable) repositories in one pass
 
         Args:
             base_path: Base directory to scan from
+            spinner: Spinner whose message shows the counts found so far
 
         Returns:
             Tuple of (active_repos, disabled_repos) lists containing (folder_name, full_path)
@@ -38,33 +101,17 @@ class GitRemoveSubmodule:
         disabled_repos = []
 
         try:
-            for root, dirs, files in os.walk(base_path):
-                # Skip the root .git and .git_disable directories
-                if root == base_path:
-                    if ".git" in dirs:
-                        dirs.remove(".git")
-                    if ".git_disable" in dirs:
-                        dirs.remove(".git_disable")
-                    continue
-
-                folder_name = os.path.basename(root)
-
-                # Check for both .git and .git_disable in one pass
-                has_git = ".git" in dirs
-                has_git_disable = ".git_disable" in dirs
-
-                if has_git:
-                    nested_repos.append((folder_name, root))
-                    dirs.remove(".git")  # Don't traverse into .git
-
-                if has_git_disable:
-                    disabled_repos.append((folder_name, root))
-                    # Don't traverse into .git_disable
-                    dirs.remove(".git_disable")
+            for active, disabled in self._iter_scan(base_path):
+                nested_repos.extend(active)
+                disabled_repos.extend(disabled)
+                if spinner and (active or disabled):
+                    spinner.update(
+                        f"Scanning for repositories... {len(nested_repos)} active, "
+                        f"{len(disabled_repos)} disabled found")
 
             # Update both lists
             self.nested_repos = nested_repos
-            self.disabled_repos = disabled_repos
+            self.disabled_repos = {path: name for name, path in disabled_repos}
             self.save_state()
 
             return nested_repos, disabled_repos
@@ -72,6 +119,71 @@ class GitRemoveSubmodule:
         except Exception as e:
             raise GitError(f"Error scanning for repositories: {str(e)}")
 
+    def iter_nested_repositories(
+            self, base_path: str = ".") -> Iterator[Tuple[str, str]]:
+        """
+        Yield active nested repositories as they are discovered
+
+        Unlike scan_all_repositories, this does not update the stored
+        lists or the state file.
+
+        Args:
+            base_path: Base directory to scan from
+
+        Yields:
+            (folder_name, full_path) for each directory containing .git
+        """
+        for active, _ in self._iter_scan(base_path):
+            yield from active
+
+    def _iter_scan(
+            self, base_path: str
+    ) -> Iterator[Tuple[List[Tuple[str, str]], List[Tuple[str, str]]]]:
+        """Yield (active, disabled) repositories for each top-level directory"""
+        # The root's own .git and .git_disable are not nested repos
+        listing = _list_directory(base_path)
+        top_dirs = listing[2] if listing else []
+
+        # Directory reads release the GIL, so top-level subtrees are walked
+        # concurrently; map yields each result in directory order as it lands
+        workers = min(_SCAN_WORKERS, len(top_dirs))
+        if workers > 1:
+            with ThreadPoolExecutor(max_workers=workers) as pool:
+                yield from pool.map(
+                    lambda top: self._scan_subtree(*top), top_dirs)
+        else:
+            for top in top_dirs:
+                yield self._scan_subtree(*top)
+
+    def _scan_subtree(
+            self, path: str, folder_name: str
+    ) -> Tuple[List[Tuple[str, str]], List[Tuple[str, str]]]:
+        """Find active and disabled repositories at or below one directory"""
+        nested_repos = []
+        disabled_repos = []
+
+        # Depth-first; each folder name travels with its path
+        stack = [(path, folder_name)]
+        while stack:
+            root, folder_name = stack.pop()
+            listing = _list_directory(root)
+            if listing is None:
+                continue
+            has_git, has_git_disable, subdirs = listing
+
+            if has_git_disable:
+                disabled_repos.append((folder_name, root))
+            if has_git:
+                nested_repos.append((folder_name, root))
+            if has_git or has_git_disable:
+                # Its working tree belongs to that repository, even disabled
+                continue
+
+            # Reversed so siblings are visited in directory order
+            stack.extend(reversed(subdirs))
+
+        return nested_repos, disabled_repos
+
     def scan_nested_repositories(
             self, base_path: str = ".") -> List[Tuple[str, str]]:
         """Legacy method - use scan_all_repositories for better performance"""
@@ -84,25 +196,36 @@ class GitRemoveSubmodule:
         _, disabled_repos = self.scan_all_repositories(base_path)
         return disabled_repos
 
+    def disabled_repo_list(self) -> List[Tuple[str, str]]:
+        """Return disabled repositories as (folder_name, full_path) pairs"""
+        return [(name, path) for path, name in self.disabled_repos.items()]
+
     def load_state(self) -> None:
         """Load persistent state from file"""
         try:
             if os.path.exists(self.state_file):
                 with open(self.state_file, 'r') as f:
                     data = json.load(f)
-                    self.disabled_repos = data.get('disabled_repos', [])
+                    self.disabled_repos = {
+                        path: name
+                        for name, path in data.get('disabled_repos', [])
+                    }
         except Exception as e:
             print(f"Warning: Could not load state file: {str(e)}")
-            self.disabled_repos = []
+            self.disabled_repos = {}
 
     def save_state(self) -> None:
         """Save persistent state to file"""
         try:
             data = {
-                'disabled_repos': self.disabled_repos
+                'disabled_repos': self.disabled_repo_list()
             }
-            with open(self.state_file, 'w') as f:
+            # Write beside the real file and swap it in, so an interrupted
+            # save never leaves a truncated state file behind
+            tmp_file = self.state_file + ".tmp"
+            with open(tmp_file, 'w') as f:
                 json.dump(data, f, indent=2)
+            os.replace(tmp_file, self.state_file)
         except Exception as e:
             print(f"Warning: Could not save state file: {str(e)}")
 
@@ -112,12 +235,12 @@ class GitRemoveSubmodule:
             print("No nested repositories found in the codebase.")
             return
 
-        print("\n Found nested repositories/submodules:")
-        print("=" * 50)
-        for i, (folder_name, full_path) in enumerate(self.nested_repos, 1):
-            print(f"{i}. {folder_name}")
-            print(f"   Path: {full_path}")
-            print()
+        lines = ["\n Found nested repositories/submodules:", "=" * 50]
+        lines += [
+            f"{i}. {folder_name}\n   Path: {full_path}\n"
+            for i, (folder_name, full_path) in enumerate(self.nested_repos, 1)
+        ]
+        sys.stdout.write("\n".join(lines) + "\n")
 
     def choose_repository(self) -> Optional[Tuple[str, str]]:
         """
@@ -150,28 +273,28 @@ class GitRemoveSubmodule:
             True if successful, False otherwise
         """
         git_path = os.path.join(repo_path, ".git")
-        disabled_path = os.path.join(repo_path, ".git_disable")
+        disabled_path = git_path + "_disable"
+        folder_name = os.path.basename(repo_path)
 
         try:
-            if not os.path.exists(git_path):
+            if not os.path.lexists(git_path):
                 print(f" No .git directory found in {repo_path}")
                 return False
 
-            if os.path.exists(disabled_path):
+            if os.path.lexists(disabled_path):
                 print(
                     f" Repository already appears to be disabled (.git_disable exists)")
                 return False
 
             # Step 1: Rename .git to .git_disable
-            os.rename(git_path, disabled_path)
+            os.replace(git_path, disabled_path)
             print(f" Repository disabled: .git → .git_disable")
 
             # Step 2: Remove from git cache
-            rel_path = os.path.relpath(repo_path)
+            rel_path = self._relative_path(repo_path)
             result = subprocess.run(
                 ["git", "rm", "--cached", "-r", rel_path],
                 capture_output=True,
-                text=True,
                 cwd="."
             )
 
@@ -179,30 +302,41 @@ class GitRemoveSubmodule:
                 print(f" Removed {rel_path} from git cache")
                 print("   The folder is now pushable as regular files")
 
-                # Add to disabled repos list for recovery tracking
-                folder_name = os.path.basename(repo_path)
-                self.disabled_repos.append((folder_name, repo_path))
+                # Move it to the disabled list; no rescan needed to see it
+                self.nested_repos = [
+                    repo for repo in self.nested_repos if repo[1] != repo_path
+                ]
+                self.disabled_repos[repo_path] = folder_name
                 self.save_state()  # Persist state
 
                 return True
             else:
                 # If git rm failed, revert the .git rename
-                os.rename(disabled_path, git_path)
-                print(f" Error removing from git cache: {result.stderr}")
+                os.replace(disabled_path, git_path)
+                print(f" Error removing from git cache: {_decode_output(result.stderr)}")
                 print("   Reverted repository disable operation")
                 return False
 
         except Exception as e:
             # Try to revert if something went wrong
             try:
-                if os.path.exists(
-                        disabled_path) and not os.path.exists(git_path):
-                    os.rename(disabled_path, git_path)
+                if os.path.lexists(
+                        disabled_path) and not os.path.lexists(git_path):
+                    os.replace(disabled_path, git_path)
             except (OSError, PermissionError, FileNotFoundError):
                 pass
             print(f" Error in disable and remove operation: {str(e)}")
             return False
 
+    def _relative_path(self, path: str) -> str:
+        """Return path relative to the working directory, for git pathspecs"""
+        # Scan results are already relative to the working directory
+        if not os.path.isabs(path):
+            return os.path.normpath(path)
+        if path.startswith(self._cwd_prefix):
+            return path[len(self._cwd_prefix):]
+        return os.path.relpath(path)
+
     def remove_from_git_cache(self, repo_path: str) -> bool:
         """
         Remove the folder from git cache to make it pushable
@@ -213,29 +347,54 @@ class GitRemoveSubmodule:
         Returns:
             True if successful, False otherwise
         """
+        return self.remove_many_from_git_cache([repo_path])[repo_path]
+
+    def remove_many_from_git_cache(
+            self, repo_paths: List[str]) -> Dict[str, bool]:
+        """
+        Remove several folders from git cache with one git invocation
+
+        Args:
+            repo_paths: Paths to the repository folders
+
+        Returns:
+            Mapping of each path to True if it was removed, False otherwise
+        """
+        if not repo_paths:
+            return {}
+
         try:
-            # Get the relative path from current working directory
-            rel_path = os.path.relpath(repo_path)
+            # Get the relative paths from current working directory
+            rel_paths = [self._relative_path(path) for path in repo_paths]
 
-            # Run git rm --cached command
+            # Run git rm --cached once for every path
             result = subprocess.run(
-                ["git", "rm", "--cached", "-r", rel_path],
+                ["git", "rm", "--cached", "-r", "--", *rel_paths],
                 capture_output=True,
-                text=True,
                 cwd="."
             )
 
             if result.returncode == 0:
-                print(f" Removed {rel_path} from git cache")
-                print("   The folder is now pushable as regular files")
-                return True
-            else:
-                print(f" Error removing from git cache: {result.stderr}")
-                return False
+                for rel_path in rel_paths:
+                    print(f" Removed {rel_path} from git cache")
+                if len(rel_paths) == 1:
+                    print("   The folder is now pushable as regular files")
+                else:
+                    print("   The folders are now pushable as regular files")
+                return dict.fromkeys(repo_paths, True)
+
+            if len(repo_paths) == 1:
+                print(f" Error removing from git cache: {_decode_output(result.stderr)}")
+                return {repo_paths[0]: False}
+
+            # git rm removes nothing if any path fails; find which ones did
+            return {
+                path: self.remove_from_git_cache(path) for path in repo_paths
+            }
 
         except Exception as e:
             print(f" Error running git rm --cached: {str(e)}")
-            return False
+            return dict.fromkeys(repo_paths, False)
 
     def recover_repository(self, repo_path: str) -> bool:
         """
@@ -248,26 +407,25 @@ class GitRemoveSubmodule:
             True if successful, False otherwise
         """
         git_path = os.path.join(repo_path, ".git")
-        disabled_path = os.path.join(repo_path, ".git_disable")
+        disabled_path = git_path + "_disable"
 
         try:
-            if not os.path.exists(disabled_path):
+            if not os.path.lexists(disabled_path):
                 print(f" No .git_disable directory found in {repo_path}")
                 return False
 
-            if os.path.exists(git_path):
+            if os.path.lexists(git_path):
                 print(f" .git directory already exists in {repo_path}")
                 return False
 
             # Rename .git_disable back to .git
-            os.rename(disabled_path, git_path)
-
-            # Remove from disabled repos list
-            folder_name = os.path.basename(repo_path)
-            self.disabled_repos = [
-                (name, path) for name, path in self.disabled_repos
-                if path != repo_path
-            ]
+            os.replace(disabled_path, git_path)
+
+            # Move it back to the active list
+            folder_name = self.disabled_repos.pop(
+                repo_path, os.path.basename(repo_path))
+            if all(path != repo_path for _, path in self.nested_repos):
+                self.nested_repos.append((folder_name, repo_path))
             self.save_state()  # Persist state
 
             print(f" Repository recovered: .git_disable → .git")
@@ -283,18 +441,20 @@ class GitRemoveSubmodule:
             print("No disabled repositories found.")
             return
 
-        print("\n Currently disabled repositories:")
-        print("=" * 40)
-        for i, (folder_name, full_path) in enumerate(self.disabled_repos, 1):
-            print(f"{i}. {folder_name}")
-            print(f"   Path: {full_path}")
-            print()
+        lines = ["\n Currently disabled repositories:", "=" * 40]
+        lines += [
+            f"{i}. {folder_name}\n   Path: {full_path}\n"
+            for i, (folder_name, full_path) in enumerate(
+                self.disabled_repo_list(), 1)
+        ]
+        sys.stdout.write("\n".join(lines) + "\n")
 
     def run_interactive_menu(self) -> None:
         """Run the interactive menu for submodule management with auto-scan"""
         # Scan with loading animation for better UX
-        with loading_animation("Scanning for repositories (.git and .git_disable)..."):
-            active_repos, disabled_repos = self.scan_all_repositories()
+        with loading_context("Scanning for repositories (.git and .git_disable)...") as spinner:
+            active_repos, disabled_repos = self.scan_all_repositories(
+                spinner=spinner)
 
         # Enhanced validation: allow access if either active OR disabled
         # repositories exist
@@ -363,7 +523,9 @@ class GitRemoveSubmodule:
             input("\nPress Enter to continue...")
             return None
 
-        menu = DisabledRepositorySelectionMenu(self.disabled_repos)
+        menu = RepositorySelectionMenu(
+            self.disabled_repo_list(),
+            title=" Select Disabled Repository to Recover")
         choice = menu.run_selection()
 
         if choice == "cancel":
@@ -430,8 +592,9 @@ class SubmoduleMenu(Menu):
 
     def _rescan_repositories(self):
         """Rescan for nested repositories and disabled repositories with loading animation"""
-        with loading_animation("Rescanning for repositories (.git and .git_disable)..."):
-            active_repos, disabled_repos = self.manager.scan_all_repositories()
+        with loading_context("Rescanning for repositories (.git and .git_disable)...") as spinner:
+            active_repos, disabled_repos = self.manager.scan_all_repositories(
+                spinner=spinner)
 
         # Display results with header for quick reference
         has_active_repos = len(active_repos) > 0
@@ -478,63 +641,30 @@ class SubmoduleMenu(Menu):
 
 
 class RepositorySelectionMenu(Menu):
-    """Menu for selecting a repository from the list"""
+    """Menu for selecting an active or disabled repository from a list"""
 
-    def __init__(self, repositories: List[Tuple[str, str]]):
+    def __init__(self, repositories: List[Tuple[str, str]],
+                 title: str = " Select Repository"):
         self.repositories = repositories
-        super().__init__(" Select Repository")
+        super().__init__(title)
 
     def setup_items(self):
         """Setup menu items for repository selection"""
-        self.items = []
-
-        for folder_name, full_path in self.repositories:
-            # Show folder name and truncated path
-            display_path = full_path if len(
-                full_path) <= 50 else "..." + full_path[-47:]
-            label = f"{folder_name} ({display_path})"
-            self.items.append(
-                MenuItem(
-                    label,
-                    lambda p=full_path,
-                    n=folder_name: (
-                        n,
-                        p)))
-
+        self.items = [
+            MenuItem(self._label(folder_name, full_path),
+                     partial(self._select, index))
+            for index, (folder_name, full_path) in enumerate(self.repositories)
+        ]
         self.items.append(MenuItem("Cancel", lambda: "cancel"))
 
-    def run_selection(self):
-        """Run menu and return selection"""
-        choice = self.get_choice_with_arrows()
-        Menu.clear_screen()
-        return self.items[choice - 1].action()
+    @staticmethod
+    def _label(folder_name: str, full_path: str) -> str:
+        """Show folder name and truncated path"""
+        return f"{folder_name} ({_truncate_path(full_path)})"
 
-
-class DisabledRepositorySelectionMenu(Menu):
-    """Menu for selecting a disabled repository from the list"""
-
-    def __init__(self, repositories: List[Tuple[str, str]]):
-        self.repositories = repositories
-        super().__init__(" Select Disabled Repository to Recover")
-
-    def setup_items(self):
-        """Setup menu items for disabled repository selection"""
-        self.items = []
-
-        for folder_name, full_path in self.repositories:
-            # Show folder name and truncated path
-            display_path = full_path if len(
-                full_path) <= 50 else "..." + full_path[-47:]
-            label = f"{folder_name} ({display_path})"
-            self.items.append(
-                MenuItem(
-                    label,
-                    lambda p=full_path,
-                    n=folder_name: (
-                        n,
-                        p)))
-
-        self.items.append(MenuItem("Cancel", lambda: "cancel"))
+    def _select(self, index: int) -> Tuple[str, str]:
+        """Return the chosen (folder_name, full_path)"""
+        return self.repositories[index]
 
     def run_selection(self):
         """Run menu and return selection"""
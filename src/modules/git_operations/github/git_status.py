@@ -4,6 +4,7 @@ Handles repository status checking and display
 """
 import subprocess
 import sys
+from functools import lru_cache
 try:
     from termcolor import colored
     HAS_TERMCOLOR = True
@@ -15,6 +16,29 @@ except ImportError:
             "Warning: termcolor library not found. Install it using: pip install termcolor")
 
 
+# Status letters in precedence order and their colors:
+# D = Deleted, M = Modified, A = Added, R = Renamed, C = Copied,
+# U = Updated but unmerged; ?? = Untracked is matched separately
+_STATUS_COLORS = (
+    ('D', 'red'),
+    ('M', 'green'),
+    ('A', 'green'),
+    ('R', 'yellow'),
+    ('C', 'cyan'),
+    ('U', 'magenta'),
+)
+
+
+@lru_cache(maxsize=256)
+def _colored_status(status_part):
+    """Return a status code wrapped in its color; there are only a few codes"""
+    status_code = status_part.strip()
+    color = next(
+        (color for letter, color in _STATUS_COLORS if letter in status_code),
+        'blue' if status_code == '??' else 'white')
+    return colored(status_part, color)
+
+
 class GitStatus:
     """Handles git status operations"""
 
@@ -63,44 +87,9 @@ class GitStatus:
         if not line:
             return
 
-        # Extract the status codes (first 2 characters typically)
-        status_code = line[:2].strip()
-
         if HAS_TERMCOLOR:
-            # Different status codes and their meanings
-            # M = Modified
-            # A = Added
-            # D = Deleted
-            # R = Renamed
-            # C = Copied
-            # U = Updated but unmerged
-            # ?? = Untracked
-
-            # Determine color based on status code
-            if 'D' in status_code or status_code == 'D':  # Deleted
-                color = 'red'
-            elif 'M' in status_code or status_code == 'M':  # Modified
-                color = 'green'
-            elif 'A' in status_code or status_code == 'A':  # Added
-                color = 'green'
-            elif 'R' in status_code or status_code == 'R':  # Renamed
-                color = 'yellow'
-            elif 'C' in status_code or status_code == 'C':  # Copied
-                color = 'cyan'
-            elif 'U' in status_code or status_code == 'U':  # Unmerged
-                color = 'magenta'
-            elif status_code == '??':  # Untracked
-                color = 'blue'
-            else:
-                color = 'white'  # Default
-
             # Colorize the status code and filename separately
-            if len(line) > 2:
-                status_part = line[:2]
-                filename_part = line[2:]
-                print(colored(status_part, color) + filename_part)
-            else:
-                print(colored(line, color))
+            print(_colored_status(line[:2]) + line[2:])
         else:
             # If termcolor is not available, just print the line as is
             print(line)
@@ -6,9 +6,7 @@ API Documentation: https://console.groq.com/
 Environment Variable: GROQ_API_KEY
 """
 import os
-import json
 import re
-import requests
 from typing import Optional, Dict, List, Callable, Tuple
 from pathlib import Path
 from collections import defaultdict
@@ -17,6 +15,29 @@ from dotenv import load_dotenv
 # Load environment variables from .env file
 load_dotenv()
 
+# Patterns and keyword tables used by _analyze_file_diff on every added line
+_DEF_OR_CLASS_RE = re.compile(r"\b(def|class)\s+(\w+)")
+_IMPORT_RE = re.compile(r"(import|from)\s+")
+_DOC_LINE_KEYWORDS = ("doc", "readme", "comment", '"""', "'''")
+_PERFORMANCE_LINE_KEYWORDS = (
+    "optimize", "optimization", "performance", "faster", "cache", "benchmark",
+)
+_SECURITY_LINE_KEYWORDS = (
+    "encryption", "hashlib", "secrets", "permission", "csrf", "xss",
+    "sql injection",
+)
+_CONFIG_FILE_KEYWORDS = ("config", "settings", ".env", ".json", ".yaml", ".yml")
+_DEPENDENCY_FILE_KEYWORDS = (
+    "requirements", "package.json", "pom.xml", "dependencies",
+)
+_STYLE_FILE_EXTENSIONS = (".css", ".scss", ".sass", ".less", ".styl")
+_STYLE_PATH_SEGMENTS = ("/styles", "\\styles", "_style")
+_BUILD_FILE_NAMES = (
+    "makefile", "pyproject.toml", "setup.py", "dockerfile",
+    "github/workflows", "azure-pipelines", ".gitlab-ci",
+)
+_SECURITY_FILE_KEYWORDS = ("security", "auth", "token", "jwt")
+
 
 class GroqCommitGenerator:
     """Generate commit messages using Groq API"""
@@ -38,6 +59,30 @@ class GroqCommitGenerator:
             "Content-Type": "application/json",
         }
 
+        # requests and urllib3 are imported only once a generator is built:
+        # they are slow to load and most menu actions never need them
+        import requests
+        from requests.adapters import HTTPAdapter
+        from urllib3.util.retry import Retry
+
+        # One session for every request this generator makes, so model
+        # fallbacks and per-group messages reuse the TCP/TLS connection
+        self._session = requests.Session()
+        self._session.headers.update(self.headers)
+        # Transient rate limits and server errors are retried with backoff;
+        # Retry-After is ignored because daily-quota 429s can ask for hours,
+        # and timed-out reads move on to the next model as before
+        retry = Retry(
+            total=3,
+            read=0,
+            backoff_factor=1.0,
+            status_forcelist=(429, 500, 502, 503, 504),
+            allowed_methods=frozenset(["POST"]),
+            respect_retry_after_header=False,
+            raise_on_status=False,
+        )
+        self._session.mount("https://", HTTPAdapter(max_retries=retry))
+
     def analyze_git_changes(self, git_client) -> Dict[str, any]:
         """
         Comprehensively analyze git changes including actual code diffs
@@ -220,118 +265,60 @@ class GroqCommitGenerator:
         }
 
         try:
-            lines = diff_content.split("\n")
-            for line in lines:
+            # Facts about the file name hold for every added line; they are
+            # applied once below if the diff adds anything at all
+            file_flags = {
+                "test_changes": "test" in file_lower or "spec" in file_lower,
+                "config_changes": any(
+                    keyword in file_lower for keyword in _CONFIG_FILE_KEYWORDS),
+                "dependency_changes": any(
+                    keyword in file_lower for keyword in _DEPENDENCY_FILE_KEYWORDS),
+                "style_changes": (
+                    file_lower.endswith(_STYLE_FILE_EXTENSIONS)
+                    or any(seg in file_lower for seg in _STYLE_PATH_SEGMENTS)),
+                "build_changes": any(
+                    name in file_lower for name in _BUILD_FILE_NAMES),
+                "security_changes": any(
+                    kw in file_lower for kw in _SECURITY_FILE_KEYWORDS),
+            }
+
+            for line in diff_content.split("\n"):
                 if line.startswith("+") and not line.startswith("+++"):
                     change_details["lines_added"] += 1
                     # Detect function/class changes
-                    if re.search(r"\b(def|class|function)\s+\w+", line):
-                        match = re.search(r"\b(def|class)\s+(\w+)", line)
-                        if match:
-                            if match.group(1) == "def":
-                                change_details["functions_changed"].append(
-                                    match.group(2)
-                                )
-                            else:
-                                change_details["classes_changed"].append(
-                                    match.group(2)
-                                )
+                    match = _DEF_OR_CLASS_RE.search(line)
+                    if match:
+                        if match.group(1) == "def":
+                            change_details["functions_changed"].append(
+                                match.group(2)
+                            )
+                        else:
+                            change_details["classes_changed"].append(
+                                match.group(2)
+                            )
                     # Detect imports
-                    if re.search(r"^(import|from)\s+", line.lstrip("+")):
+                    if _IMPORT_RE.match(line.lstrip("+")):
                         change_details["imports_changed"] = True
-                    # Detect test changes
-                    if "test" in file_lower or "spec" in file_lower:
-                        change_details["test_changes"] = True
+
+                    line_lower = line.lower()
                     # Detect doc changes
-                    if any(
-                        keyword in line.lower()
-                        for keyword in ["doc", "readme", "comment", '"""', "'''"]
-                    ):
+                    if any(keyword in line_lower for keyword in _DOC_LINE_KEYWORDS):
                         change_details["doc_changes"] = True
-                    # Detect config changes
-                    if any(
-                        keyword in file_lower
-                        for keyword in [
-                            "config",
-                            "settings",
-                            ".env",
-                            ".json",
-                            ".yaml",
-                            ".yml",
-                        ]
-                    ):
-                        change_details["config_changes"] = True
-                    # Detect dependency changes
-                    if any(
-                        keyword in file_lower
-                        for keyword in [
-                            "requirements",
-                            "package.json",
-                            "pom.xml",
-                            "dependencies",
-                        ]
-                    ):
-                        change_details["dependency_changes"] = True
-                    # Detect obvious style-only files (CSS/formatting assets)
-                    if any(
-                        file_lower.endswith(ext)
-                        for ext in [
-                            ".css",
-                            ".scss",
-                            ".sass",
-                            ".less",
-                            ".styl",
-                        ]
-                    ) or any(seg in file_lower for seg in ["/styles", "\\styles", "_style"]):
-                        change_details["style_changes"] = True
-                    # Detect build / CI related files
-                    if any(
-                        name in file_lower
-                        for name in [
-                            "makefile",
-                            "pyproject.toml",
-                            "setup.py",
-                            "dockerfile",
-                            "github/workflows",
-                            "azure-pipelines",
-                            ".gitlab-ci",
-                        ]
-                    ):
-                        change_details["build_changes"] = True
                     # Detect performance-related intent from keywords
-                    if any(
-                        kw in line.lower()
-                        for kw in [
-                            "optimize",
-                            "optimization",
-                            "performance",
-                            "faster",
-                            "cache",
-                            "benchmark",
-                        ]
-                    ):
+                    if any(kw in line_lower for kw in _PERFORMANCE_LINE_KEYWORDS):
                         change_details["performance_changes"] = True
                     # Detect security-related changes
-                    if any(
-                        kw in file_lower
-                        for kw in ["security", "auth", "token", "jwt"]
-                    ) or any(
-                        kw in line.lower()
-                        for kw in [
-                            "encryption",
-                            "hashlib",
-                            "secrets",
-                            "permission",
-                            "csrf",
-                            "xss",
-                            "sql injection",
-                        ]
-                    ):
+                    if any(kw in line_lower for kw in _SECURITY_LINE_KEYWORDS):
                         change_details["security_changes"] = True
 
                 elif line.startswith("-") and not line.startswith("---"):
                     change_details["lines_removed"] += 1
 
+            if change_details["lines_added"]:
+                for flag, value in file_flags.items():
+                    if value:
+                        change_details[flag] = True
+
             # Mark pure removals (no additions) as removal-only candidates
             if (
                 change_details["lines_removed"] > 0
@@ -664,6 +651,8 @@ class GroqCommitGenerator:
         is_group: bool = False,
     ) -> Optional[str]:
         """Generate a commit message using AI only - mandatory, no fallback"""
+        import requests  # already loaded by __init__
+
         # Build the prompt for the Groq API
         prompt = self._build_prompt(changes_info, username, email, is_group=is_group)
 
@@ -698,9 +687,8 @@ class GroqCommitGenerator:
                 if preview_callback:
                     preview_callback(f"Generating with {model_name}...")
 
-                response = requests.post(
+                response = self._session.post(
                     self.base_url,
-                    headers=self.headers,
                     json=payload,
                     timeout=30,
                     verify=True
@@ -0,0 +1,369 @@
+"""
+Git push tests for PyDevToolkit-MagicCLI
+Tests staging and retry helpers of the push workflow against a real repository
+"""
+
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+import unittest
+from unittest import mock
+from pathlib import Path
+
+# Add the src directory to Python path to import modules
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from core.utils.exceptions import GitCommandError
+from core.utils.git_client import get_git_client
+from modules.git_operations.github import git_push
+from modules.git_operations.github.git_push import GitPushRetry
+
+
+class GitRepoTestCase(unittest.TestCase):
+    """Base test case running inside a throwaway Git repository"""
+
+    def setUp(self):
+        self.original_cwd = os.getcwd()
+        self.repo_dir = Path(tempfile.mkdtemp())
+        os.chdir(self.repo_dir)
+        subprocess.run(["git", "init", "-q"], check=True)
+        subprocess.run(["git", "config", "user.name", "Test User"], check=True)
+        subprocess.run(
+            ["git", "config", "user.email", "test@example.com"], check=True
+        )
+
+        # Point the shared client at this repository before constructing
+        get_git_client(working_dir=self.repo_dir)
+        self.retry = GitPushRetry()
+
+    def tearDown(self):
+        os.chdir(self.original_cwd)
+        shutil.rmtree(self.repo_dir, ignore_errors=True)
+
+    def staged_files(self):
+        """Return the set of paths currently staged in the index"""
+        result = subprocess.run(
+            ["git", "diff", "--cached", "--name-only"],
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+        return set(result.stdout.split())
+
+
+class TestGitAddBatch(GitRepoTestCase):
+    """Test batched staging with bisection on failure"""
+
+    def test_stages_all_paths_in_one_batch(self):
+        """Test that valid paths are all staged"""
+        for name in ("a.txt", "b.txt", "c.txt"):
+            (self.repo_dir / name).write_text(name)
+
+        staged, failed = self.retry._git_add_batch(["a.txt", "b.txt", "c.txt"])
+
+        self.assertEqual(sorted(staged), ["a.txt", "b.txt", "c.txt"])
+        self.assertEqual(failed, [])
+        self.assertEqual(self.staged_files(), {"a.txt", "b.txt", "c.txt"})
+
+    def test_isolates_failing_paths(self):
+        """Test that one bad path does not block the rest of its batch"""
+        for name in ("a.txt", "b.txt", "c.txt"):
+            (self.repo_dir / name).write_text(name)
+
+        original_batch_size = git_push._ADD_BATCH_SIZE
+        git_push._ADD_BATCH_SIZE = 2
+        try:
+            staged, failed = self.retry._git_add_batch(
+                ["a.txt", "missing.txt", "b.txt", "c.txt"]
+            )
+        finally:
+            git_push._ADD_BATCH_SIZE = original_batch_size
+
+        self.assertEqual(sorted(staged), ["a.txt", "b.txt", "c.txt"])
+        self.assertEqual([path for path, _ in failed], ["missing.txt"])
+        self.assertEqual(self.staged_files(), {"a.txt", "b.txt", "c.txt"})
+
+
+class TestHasStagedChanges(GitRepoTestCase):
+    """Test the index-against-HEAD check used before committing"""
+
+    def test_before_first_commit(self):
+        """Test that staged files are seen even without a HEAD"""
+        self.assertFalse(self.retry._has_staged_changes())
+        (self.repo_dir / "a.txt").write_text("a")
+        subprocess.run(["git", "add", "a.txt"], check=True)
+        self.assertTrue(self.retry._has_staged_changes())
+
+    def test_after_commit(self):
+        """Test that a committed index reports nothing staged"""
+        (self.repo_dir / "a.txt").write_text("a")
+        subprocess.run(["git", "add", "a.txt"], check=True)
+        subprocess.run(["git", "commit", "-q", "-m", "init"], check=True)
+        self.assertFalse(self.retry._has_staged_changes())
+
+        (self.repo_dir / "a.txt").write_text("b")
+        subprocess.run(["git", "add", "a.txt"], check=True)
+        self.assertTrue(self.retry._has_staged_changes())
+
+
+class TestLoadStatus(GitRepoTestCase):
+    """Test parsing of NUL-separated porcelain status"""
+
+    def test_parses_untracked_and_renamed_paths(self):
+        """Test that paths keep their first character and renames use the new path"""
+        (self.repo_dir / "old.txt").write_text("old")
+        subprocess.run(["git", "add", "old.txt"], check=True)
+        subprocess.run(["git", "commit", "-q", "-m", "init"], check=True)
+        subprocess.run(["git", "mv", "old.txt", "new.txt"], check=True)
+        (self.repo_dir / "untracked.txt").write_text("x")
+
+        entries = self.retry._load_status()
+
+        self.assertIn(("R ", "new.txt"), entries)
+        self.assertIn(("??", "untracked.txt"), entries)
+        self.assertEqual(len(entries), 2)
+
+    def test_intent_to_add_rename_skips_original_path(self):
+        """Test that a worktree rename (Y column R) does not leak its source"""
+        (self.repo_dir / "original_name.txt").write_text("content")
+        subprocess.run(["git", "add", "original_name.txt"], check=True)
+        subprocess.run(["git", "commit", "-q", "-m", "init"], check=True)
+        os.rename("original_name.txt", "renamed.txt")
+        subprocess.run(["git", "add", "-N", "renamed.txt"], check=True)
+
+        entries = self.retry._load_status()
+
+        self.assertEqual(entries, [(" R", "renamed.txt")])
+
+    def test_lists_each_file_in_untracked_directory(self):
+        """Test that a new directory is reported file by file"""
+        (self.repo_dir / "pkg").mkdir()
+        (self.repo_dir / "pkg" / "a.py").write_text("a")
+        (self.repo_dir / "pkg" / "b.py").write_text("b")
+
+        entries = self.retry._load_status()
+
+        self.assertEqual(sorted(entries), [("??", "pkg/a.py"), ("??", "pkg/b.py")])
+
+    @unittest.skipIf(sys.platform == "win32", "needs byte filenames")
+    def test_undecodable_path_round_trips(self):
+        """Test that a non-UTF-8 file name decodes to the on-disk name"""
+        path = os.fsdecode(b"caf\xe9.txt")
+        (self.repo_dir / path).write_text("x")
+
+        self.assertEqual(self.retry._load_status(), [("??", path)])
+
+    def test_cache_is_reset_after_staging(self):
+        """Test that staging invalidates the cached status"""
+        (self.repo_dir / "a.txt").write_text("a")
+        self.assertEqual(self.retry._load_status(), [("??", "a.txt")])
+
+        self.retry._git_add_batch(["a.txt"])
+
+        self.assertEqual(self.retry._load_status(), [("A ", "a.txt")])
+
+
+class TestAnalyzeError(GitRepoTestCase):
+    """Test push error classification"""
+
+    def decide(self, stderr):
+        error = GitCommandError("git push", 1, stderr=stderr)
+        strategy = self.retry.config.strategies[0]
+        return self.retry._analyze_error_and_decide(error, 1, strategy)
+
+    def test_auth_and_permission_errors_stop(self):
+        """Test that credential problems are not retried"""
+        self.assertEqual(self.decide("fatal: Authentication failed"), (False, 0))
+        self.assertEqual(self.decide("remote: Permission denied"), (False, 0))
+        self.assertEqual(self.decide("remote: Repository not found."), (False, 0))
+
+    def test_network_errors_wait_before_retry(self):
+        """Test that network errors continue with a backoff"""
+        should_continue, wait_time = self.decide(
+            "fatal: Could not resolve host: github.com"
+        )
+        self.assertTrue(should_continue)
+        self.assertGreater(wait_time, 0)
+
+    def test_other_errors_move_to_next_strategy(self):
+        """Test that unclassified errors continue immediately"""
+        self.assertEqual(
+            self.decide("! [rejected] main -> main (fetch first)"),
+            (True, 0),
+        )
+
+    def test_stops_when_deadline_passed(self):
+        """Test that no retry is scheduled past the overall push budget"""
+        self.retry._deadline = time.monotonic()
+        should_continue, _ = self.decide("fatal: unable to access: Connection reset")
+        self.assertFalse(should_continue)
+
+
+class TestNextStrategy(GitRepoTestCase):
+    """Test targeted strategy selection after a failed push"""
+
+    def next_name(self, categories, tried, last=None):
+        strategy = self.retry._next_strategy_for(set(categories), set(tried), last)
+        return strategy.name if strategy else None
+
+    def test_starts_with_first_strategy(self):
+        """Test that the first attempt is the standard push"""
+        self.assertEqual(self.next_name([], []), "normal")
+
+    def test_diverged_jumps_to_force_with_lease(self):
+        """Test that a rejected push skips the hook and upstream strategies"""
+        self.assertEqual(
+            self.next_name(["diverged"], ["normal"]), "force-with-lease"
+        )
+        self.assertIsNone(
+            self.next_name(["diverged"], ["normal", "force-with-lease", "force"])
+        )
+
+    def test_network_retries_same_strategy(self):
+        """Test that network failures retry the strategy that just failed"""
+        last = self.retry.config.strategies[2]
+        self.assertEqual(
+            self.next_name(["network"], ["normal", last.name], last), last.name
+        )
+
+    def test_unclassified_walks_ladder(self):
+        """Test that unknown failures fall back to the next untried strategy"""
+        self.assertEqual(self.next_name([], ["normal"]), "set-upstream")
+
+    def test_hook_failure_prunes_strategies_without_no_verify(self):
+        """Test that strategies still running hooks are not retried"""
+        strategies = self.retry.config.strategies
+        candidates = [
+            s for s in strategies
+            if self.retry._strategy_can_help(s, frozenset(["hook"]))
+        ]
+
+        self.assertTrue(all("--no-verify" in s.flags for s in candidates))
+        strategy = self.retry._next_strategy_for(
+            frozenset(), {"normal", "no-verify"}, candidates=candidates
+        )
+        self.assertEqual(strategy.name, "no-verify-upstream")
+
+    def test_auth_failure_prunes_everything(self):
+        """Test that no strategy is considered able to fix bad credentials"""
+        self.assertFalse(any(
+            self.retry._strategy_can_help(s, frozenset(["auth"]))
+            for s in self.retry.config.strategies
+        ))
+
+
+class TestProbeRepo(GitRepoTestCase):
+    """Test the one-shot repository probe"""
+
+    def test_reports_repository_facts(self):
+        """Test that the probe finds the work tree, Git dir and remote"""
+        subprocess.run(
+            ["git", "remote", "add", "origin", "https://example.com/r.git"],
+            check=True,
+        )
+
+        info = self.retry._probe_repo()
+
+        self.assertTrue(info["is_repo"])
+        self.assertTrue(info["has_origin"])
+        self.assertEqual(
+            Path(info["git_dir"]).resolve(), (self.repo_dir / ".git").resolve()
+        )
+
+    def test_no_origin(self):
+        """Test that a repository without origin is reported as such"""
+        info = self.retry._probe_repo()
+
+        self.assertTrue(info["is_repo"])
+        self.assertFalse(info["has_origin"])
+
+
+class TestFixGitLockFiles(GitRepoTestCase):
+    """Test removal of stale Git lock files"""
+
+    def test_removes_stale_locks(self):
+        """Test that index and branch locks are removed"""
+        index_lock = self.repo_dir / ".git" / "index.lock"
+        branch_lock = self.repo_dir / ".git" / "refs" / "heads" / "main.lock"
+        index_lock.write_text("")
+        branch_lock.write_text("")
+
+        self.assertTrue(self.retry._fix_git_lock_files())
+        self.assertFalse(index_lock.exists())
+        self.assertFalse(branch_lock.exists())
+
+
+class TestSmartStaging(GitRepoTestCase):
+    """Test staging fallback selection"""
+
+    def test_clean_tree_needs_no_staging(self):
+        """Test that a clean working tree skips staging entirely"""
+        self.assertTrue(self.retry._smart_stage_changes_quiet())
+        self.assertIsNone(self.retry._last_staging_error)
+
+    def test_recovers_from_stale_index_lock(self):
+        """Test that a stale index.lock is cleared and staging retried"""
+        (self.repo_dir / "a.txt").write_text("a")
+        (self.repo_dir / ".git" / "index.lock").write_text("")
+
+        self.assertTrue(self.retry._smart_stage_changes_quiet())
+        self.assertEqual(self.staged_files(), {"a.txt"})
+
+
+class TestConfirmDestructiveOperation(GitRepoTestCase):
+    """Test confirmation of force pushes"""
+
+    def test_declines_without_terminal(self):
+        """Test that a non-interactive session never force pushes"""
+        strategy = self.retry.config.strategies[-1]
+        with mock.patch.object(sys.stdin, "isatty", return_value=False):
+            self.assertFalse(self.retry._confirm_destructive_operation(strategy))
+
+
+class TestGitUserIdentity(GitRepoTestCase):
+    """Test reading the commit identity in one git config call"""
+
+    def test_reads_name_and_email(self):
+        """Test that both values come back, with spaces preserved"""
+        self.assertEqual(
+            git_push._git_user_identity(self.retry.git),
+            ("Test User", "test@example.com"),
+        )
+
+
+class TestRunInBackground(GitRepoTestCase):
+    """Test Git commands started ahead of the push summary"""
+
+    def test_returns_command_result(self):
+        """Test that the getter waits for and returns the command output"""
+        result = self.retry._run_in_background(["git", "status", "--porcelain"])
+
+        self.assertEqual(result().returncode, 0)
+
+
+class TestWaitChangelog(GitRepoTestCase):
+    """Test waiting on background changelog generation"""
+
+    def test_waits_for_running_thread(self):
+        """Test that wait_changelog reports whether generation finished"""
+        release = threading.Event()
+        self.retry._changelog_thread = threading.Thread(target=release.wait)
+        self.retry._changelog_thread.start()
+
+        self.assertFalse(self.retry.wait_changelog(timeout=0.01))
+
+        release.set()
+        self.assertTrue(self.retry.wait_changelog())
+        self.assertIsNone(self.retry._changelog_thread)
+
+    def test_nothing_running(self):
+        """Test that wait_changelog returns immediately without a thread"""
+        self.assertTrue(self.retry.wait_changelog())
+
+
+if __name__ == "__main__":
+    unittest.main()
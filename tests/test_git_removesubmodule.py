@@ -0,0 +1,164 @@
+"""
+Git remove submodule tests for PyDevToolkit-MagicCLI
+Tests nested repository discovery against a temporary directory tree
+"""
+
+import json
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+# Add the src directory to Python path to import modules
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from modules.git_operations.github.git_removesubmodule import GitRemoveSubmodule
+
+
+class SubmoduleTestCase(unittest.TestCase):
+    """Base test case running inside a throwaway directory tree"""
+
+    def setUp(self):
+        self.original_cwd = os.getcwd()
+        self.base_dir = Path(tempfile.mkdtemp())
+        os.chdir(self.base_dir)
+        (self.base_dir / ".git").mkdir()
+        self.manager = GitRemoveSubmodule()
+
+    def tearDown(self):
+        os.chdir(self.original_cwd)
+        shutil.rmtree(self.base_dir, ignore_errors=True)
+
+    def make_repo(self, relative_path, marker=".git"):
+        """Create a directory containing a repository marker"""
+        repo = self.base_dir / relative_path
+        (repo / marker).mkdir(parents=True)
+        return repo
+
+
+class TestScanAllRepositories(SubmoduleTestCase):
+    """Test discovery of active and disabled nested repositories"""
+
+    def test_finds_active_and_disabled(self):
+        """Test that both markers are reported and the root repo is not"""
+        self.make_repo("libs/active")
+        self.make_repo("disabled", marker=".git_disable")
+
+        active, disabled = self.manager.scan_all_repositories(".")
+
+        self.assertEqual([name for name, _ in active], ["active"])
+        self.assertEqual([name for name, _ in disabled], ["disabled"])
+
+    def test_skips_dependency_and_cache_dirs(self):
+        """Test that repositories under node_modules and venvs are ignored"""
+        self.make_repo("node_modules/pkg")
+        self.make_repo(".venv/src/dep")
+        self.make_repo("app")
+
+        active, _ = self.manager.scan_all_repositories(".")
+
+        self.assertEqual([name for name, _ in active], ["app"])
+
+    def test_does_not_descend_into_nested_repo(self):
+        """Test that a repository inside a nested repository is not reported"""
+        self.make_repo("outer")
+        self.make_repo("outer/inner")
+
+        active, _ = self.manager.scan_all_repositories(".")
+
+        self.assertEqual([name for name, _ in active], ["outer"])
+
+    def test_does_not_descend_into_disabled_repo(self):
+        """Test that a disabled repository's working tree is not walked"""
+        self.make_repo("outer", marker=".git_disable")
+        self.make_repo("outer/inner")
+
+        active, disabled = self.manager.scan_all_repositories(".")
+
+        self.assertEqual(active, [])
+        self.assertEqual([name for name, _ in disabled], ["outer"])
+
+    @unittest.skipIf(sys.platform == "win32", "needs symlinks")
+    def test_does_not_follow_symlinked_directories(self):
+        """Test that a symlink loop or alias is never walked"""
+        self.make_repo("real/repo")
+        os.symlink(self.base_dir / "real", self.base_dir / "alias")
+        os.symlink(self.base_dir, self.base_dir / "real" / "loop")
+
+        active, _ = self.manager.scan_all_repositories(".")
+
+        self.assertEqual(active, [("repo", os.path.join(".", "real", "repo"))])
+
+    def test_iter_nested_repositories_streams_active(self):
+        """Test that the generator yields active repositories only"""
+        self.make_repo("a/one")
+        self.make_repo("b/two")
+        self.make_repo("c", marker=".git_disable")
+
+        found = sorted(self.manager.iter_nested_repositories("."))
+
+        self.assertEqual([name for name, _ in found], ["one", "two"])
+        self.assertEqual(self.manager.nested_repos, [])
+
+
+class TestRecoverRepository(SubmoduleTestCase):
+    """Test restoring a disabled repository and the persisted state"""
+
+    def test_recover_updates_state(self):
+        """Test that a recovered repository leaves the saved disabled list"""
+        repo = str(self.make_repo("lib", marker=".git_disable"))
+        Path(".submodule_state.json").write_text(
+            json.dumps({"disabled_repos": [["lib", repo]]}))
+        manager = GitRemoveSubmodule()
+        self.assertEqual(manager.disabled_repo_list(), [("lib", repo)])
+
+        self.assertTrue(manager.recover_repository(repo))
+
+        self.assertTrue(os.path.isdir(os.path.join(repo, ".git")))
+        self.assertEqual(manager.disabled_repos, {})
+        self.assertEqual(manager.nested_repos, [("lib", repo)])
+        saved = json.loads(Path(".submodule_state.json").read_text())
+        self.assertEqual(saved["disabled_repos"], [])
+
+
+class TestRemoveManyFromGitCache(SubmoduleTestCase):
+    """Test batched removal of folders from the Git index"""
+
+    def setUp(self):
+        super().setUp()
+        shutil.rmtree(self.base_dir / ".git")
+        subprocess.run(["git", "init", "-q"], check=True)
+        for name in ("one", "two"):
+            (self.base_dir / name).mkdir()
+            (self.base_dir / name / "f.txt").write_text(name)
+        subprocess.run(["git", "add", "one", "two"], check=True)
+
+    def indexed_files(self):
+        result = subprocess.run(
+            ["git", "ls-files"], capture_output=True, text=True, check=True)
+        return result.stdout.split()
+
+    def test_removes_all_paths(self):
+        """Test that every folder leaves the index in one call"""
+        paths = [str(self.base_dir / "one"), str(self.base_dir / "two")]
+
+        result = self.manager.remove_many_from_git_cache(paths)
+
+        self.assertEqual(result, dict.fromkeys(paths, True))
+        self.assertEqual(self.indexed_files(), [])
+
+    def test_reports_failing_path(self):
+        """Test that an unmatched path does not block the others"""
+        paths = [str(self.base_dir / "one"), str(self.base_dir / "missing")]
+
+        result = self.manager.remove_many_from_git_cache(paths)
+
+        self.assertEqual(result, {paths[0]: True, paths[1]: False})
+        self.assertEqual(self.indexed_files(), ["two/f.txt"])
+
+
+if __name__ == "__main__":
+    unittest.main()